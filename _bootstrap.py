@@ -0,0 +1,17 @@
+"""
+Make the in-tree radicle_mcp package importable for the scripts in this repository.
+
+Importing this module is all a script needs to do. When the package is
+installed (pip install -e .) the import is already resolvable and sys.path
+is left alone; otherwise src/ is put on it, once per process.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+# Where the in-tree package lives, as the string sys.path expects
+SRC_DIR = str(Path(__file__).resolve().parent / "src")
+
+if importlib.util.find_spec("radicle_mcp") is None and SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
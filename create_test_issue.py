@@ -3,9 +3,43 @@
 Create a test issue to demonstrate sync functionality.
 """
 
-import asyncio
+import functools
 import os
-from github_radicle_sync import GitHubAPI
+from typing import Optional
+
+import aiohttp
+
+import entrypoint
+from github_radicle_sync import GitHubAPI, new_github_session
+
+_BODY_TEMPLATE = """This is a test issue created to demonstrate the GitHub ↔ Radicle synchronization functionality.
+
+**Features being tested:**
+- Issue creation and sync
+- Metadata preservation  
+- Idempotent operations
+- Mapping database
+
+This issue should be automatically synced to Radicle when the sync process runs.
+
+Created by: `{script}`"""
+
+# Shared across calls so repeated runs reuse the same TLS connection
+_SESSION: Optional[aiohttp.ClientSession] = None
+
+
+def _shared_session() -> aiohttp.ClientSession:
+    """Return the module's HTTP session, opening it on first use."""
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        _SESSION = new_github_session()
+    return _SESSION
+
+
+@functools.lru_cache(maxsize=4)
+def _api(token: str, repo: str) -> GitHubAPI:
+    """Return the GitHubAPI for a token and repository, built once per process."""
+    return GitHubAPI(token, repo, session=_shared_session())
 
 
 async def create_test_issue():
@@ -17,24 +51,14 @@ async def create_test_issue():
     
     github_repo = "fovi-llc/radicle-mcp"
     
-    github_api = GitHubAPI(github_token, github_repo)
+    github_api = _api(github_token, github_repo)
     
     print(f"🔧 Creating test issue in {github_repo}...")
     
     try:
-        test_issue = github_api.create_issue(
+        test_issue = await github_api.create_issue(
             title="Test Issue for GitHub ↔ Radicle Sync",
-            body="""This is a test issue created to demonstrate the GitHub ↔ Radicle synchronization functionality.
-
-**Features being tested:**
-- Issue creation and sync
-- Metadata preservation  
-- Idempotent operations
-- Mapping database
-
-This issue should be automatically synced to Radicle when the sync process runs.
-
-Created by: `create_test_issue.py`""",
+            body=_BODY_TEMPLATE.format(script="create_test_issue.py"),
             labels=["test", "sync", "demo"]
         )
         
@@ -48,5 +72,16 @@ Created by: `create_test_issue.py`""",
         print(f"❌ Failed to create test issue: {e}")
 
 
+async def main():
+    """Create the test issue and release the shared HTTP session."""
+    try:
+        await create_test_issue()
+    finally:
+        if _SESSION is not None:
+            await _SESSION.close()
+        # The cached clients hold the closed session; a later run builds new ones
+        _api.cache_clear()
+
+
 if __name__ == "__main__":
-    asyncio.run(create_test_issue())
+    entrypoint.run(main())
@@ -5,18 +5,14 @@ Create a test issue in Radicle to demonstrate reverse sync functionality.
 
 import asyncio
 import subprocess
+from typing import IO, List
 
+import entrypoint
 
-async def create_test_radicle_issue():
-    """Create a test issue in Radicle."""
-    print("🔧 Creating test issue in Radicle...")
-    
-    try:
-        # Create a test issue using rad CLI
-        process = await asyncio.create_subprocess_exec(
-            "rad", "issue", "open",
-            "--title", "Test Radicle Issue for GitHub Sync",
-            "--description", """This is a test issue created in Radicle to demonstrate the Radicle → GitHub synchronization functionality.
+# Seconds to wait for rad before killing it
+RAD_TIMEOUT = 30.0
+
+_RAD_BODY_TEMPLATE = """This is a test issue created in Radicle to demonstrate the Radicle → GitHub synchronization functionality.
 
 **Features being tested:**
 - Issue creation from Radicle
@@ -26,18 +22,59 @@ async def create_test_radicle_issue():
 
 This issue should be automatically synced to GitHub when the sync process runs.
 
-Created by: `create_test_radicle_issue.py`""",
+Created by: `{script}`"""
+
+
+async def spawn(command: List[str]) -> subprocess.Popen:
+    """Start a subprocess from a worker thread so fork/exec doesn't stall the event loop."""
+    return await asyncio.to_thread(
+        subprocess.Popen, command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+
+
+async def pipe_reader(pipe: IO[bytes]) -> asyncio.StreamReader:
+    """Wrap a subprocess pipe in an asyncio StreamReader."""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), pipe)
+    return reader
+
+
+async def create_test_radicle_issue():
+    """Create a test issue in Radicle."""
+    print("🔧 Creating test issue in Radicle...")
+    
+    try:
+        # Create a test issue using rad CLI
+        process = await spawn([
+            "rad", "issue", "open",
+            "--title", "Test Radicle Issue for GitHub Sync",
+            "--description", _RAD_BODY_TEMPLATE.format(script="create_test_radicle_issue.py"),
             "--label", "test",
-            "--label", "radicle-sync", 
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
+            "--label", "radicle-sync",
+        ])
+        stdout_reader = await pipe_reader(process.stdout)
+        stderr_reader = await pipe_reader(process.stderr)
+        
+        async def relay_output() -> bytes:
+            # Drain stderr in the background while stdout is relayed line by line
+            stderr_task = asyncio.create_task(stderr_reader.read())
+            async for line in stdout_reader:
+                print(f"   Output: {line.decode().rstrip()}")
+            stderr = await stderr_task
+            await asyncio.to_thread(process.wait)
+            return stderr
         
-        stdout, stderr = await process.communicate()
+        try:
+            stderr = await asyncio.wait_for(relay_output(), RAD_TIMEOUT)
+        except asyncio.TimeoutError:
+            process.kill()
+            await asyncio.to_thread(process.wait)
+            print(f"❌ rad did not finish within {RAD_TIMEOUT:g}s")
+            return
         
         if process.returncode == 0:
             print(f"✅ Test issue created successfully in Radicle!")
-            print(f"   Output: {stdout.decode().strip()}")
             print(f"\n💡 Now run the sync to see it appear in GitHub:")
             print(f"   python github_radicle_sync.py")
             print(f"\n🔍 You can also list Radicle issues with:")
@@ -51,4 +88,4 @@ Created by: `create_test_radicle_issue.py`""",
 
 
 if __name__ == "__main__":
-    asyncio.run(create_test_radicle_issue())
+    entrypoint.run(create_test_radicle_issue())
@@ -3,49 +3,59 @@
 
 import asyncio
 import sys
-from pathlib import Path
-
-# Add the src directory to the path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+from io import StringIO
 
+import _bootstrap  # noqa: F401  (puts src/ on sys.path if needed)
+import entrypoint
 from radicle_mcp.server import (
     rad_help, rad_id, rad_status, rad_patch_list, 
     rad_issue_list, rad_remote_list
 )
 
 
+def truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with '...'."""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
 async def demo_radicle_mcp():
     """Demonstrate what we can see with Radicle through our MCP server."""
-    print("🚀 Radicle MCP Server Demo")
-    print("=" * 50)
+    # The queries are independent, so run them concurrently and pay
+    # roughly one rad startup instead of five in a row
+    id_result, status_result, patch_result, issue_result, remote_result = await asyncio.gather(
+        rad_id(), rad_status(), rad_patch_list(), rad_issue_list(), rad_remote_list()
+    )
+    
+    # Assemble the whole report and emit it with a single write
+    report = StringIO()
+    report.write("🚀 Radicle MCP Server Demo\n")
+    report.write("=" * 50 + "\n")
     
     # Test 1: Get Radicle ID
-    print("\n1. 🆔 Getting Radicle Node ID:")
-    id_result = await rad_id()
-    print(id_result[:200] + "..." if len(id_result) > 200 else id_result)
+    report.write("\n1. 🆔 Getting Radicle Node ID:\n")
+    report.write(truncate(id_result, 200) + "\n")
     
     # Test 2: Repository Status
-    print("\n2. 📊 Repository Status:")
-    status_result = await rad_status()
-    print(status_result[:200] + "..." if len(status_result) > 200 else status_result)
+    report.write("\n2. 📊 Repository Status:\n")
+    report.write(truncate(status_result, 200) + "\n")
     
     # Test 3: List Patches
-    print("\n3. 📋 Patches:")
-    patch_result = await rad_patch_list()
-    print(patch_result)
+    report.write("\n3. 📋 Patches:\n")
+    report.write(patch_result + "\n")
     
     # Test 4: List Issues
-    print("\n4. 🐛 Issues:")
-    issue_result = await rad_issue_list()
-    print(issue_result)
+    report.write("\n4. 🐛 Issues:\n")
+    report.write(issue_result + "\n")
     
     # Test 5: List Remotes
-    print("\n5. 🌐 Remotes:")
-    remote_result = await rad_remote_list()
-    print(remote_result[:300] + "..." if len(remote_result) > 300 else remote_result)
+    report.write("\n5. 🌐 Remotes:\n")
+    report.write(truncate(remote_result, 300) + "\n")
+    
+    report.write("\n🎉 Demo complete! The MCP server can successfully wrap Radicle CLI commands.\n")
     
-    print("\n🎉 Demo complete! The MCP server can successfully wrap Radicle CLI commands.")
+    sys.stdout.write(report.getvalue())
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
-    asyncio.run(demo_radicle_mcp())
+    entrypoint.run(demo_radicle_mcp())
@@ -4,10 +4,13 @@ Demo script showing GitHub ↔ Radicle synchronization functionality.
 """
 
 import asyncio
+import contextlib
 import os
 import sys
 from datetime import datetime
 
+import entrypoint
+
 
 async def demo_sync():
     """Demonstrate sync functionality."""
@@ -39,6 +42,7 @@ async def demo_sync():
         return
     
     # Test with actual sync
+    syncer = None
     try:
         from github_radicle_sync import GitHubRadicleSyncer
         
@@ -51,35 +55,63 @@ async def demo_sync():
         
         print("\n🔍 Testing connectivity...")
         
-        # Test GitHub connectivity
-        github_issues = syncer.github.get_issues()
-        print(f"✅ GitHub: Found {len(github_issues)} issues")
+        # Probe GitHub and Radicle concurrently so HTTP round-trips overlap
+        # with the rad subprocesses, reporting each result as soon as it lands
+        semaphore = asyncio.Semaphore(4)
         
-        github_prs = syncer.github.get_pull_requests()
-        print(f"✅ GitHub: Found {len(github_prs)} pull requests")
+        async def probe_github():
+            async with semaphore:
+                n_issues, n_prs = await syncer.github.count_items("open")
+            return [f"✅ GitHub: Found {n_issues} open issues",
+                    f"✅ GitHub: Found {n_prs} open pull requests"]
         
-        # Test Radicle connectivity
-        radicle_issues = await syncer.radicle.get_issues()
-        print(f"✅ Radicle: Found {len(radicle_issues)} issues")
+        async def probe_radicle(kind, coro):
+            async with semaphore:
+                items = await coro
+            return [f"✅ Radicle: Found {len(items)} {kind}"]
         
-        radicle_patches = await syncer.radicle.get_patches()
-        print(f"✅ Radicle: Found {len(radicle_patches)} patches")
+        probes = [
+            probe_github(),
+            probe_radicle("issues", syncer.radicle.get_issues()),
+            probe_radicle("patches", syncer.radicle.get_patches())
+        ]
+        for next_done in asyncio.as_completed(probes):
+            for line in await next_done:
+                print(line)
         
         # Show current mappings
-        issue_mappings = len(syncer.db.data.get('issues', {}))
-        patch_mappings = len(syncer.db.data.get('patches', {}))
+        issue_mappings = syncer.db.count('issues')
+        patch_mappings = syncer.db.count('patches')
         last_sync = syncer.db.data.get('last_sync', 'Never')
+        synced_through = syncer.db.data.get('last_synced_through') or 'Never'
         
         print(f"\n📊 Current sync state:")
         print(f"  Issue mappings: {issue_mappings}")
         print(f"  Patch mappings: {patch_mappings}")
         print(f"  Last sync: {last_sync}")
+        print(f"  GitHub issues synced through: {synced_through}")
+        
+        # Work out the sync plan while the user decides; input() runs in a
+        # thread so the event loop keeps servicing it
+        precompute_task = asyncio.create_task(syncer.dry_run_plan())
         
         # Ask user if they want to perform actual sync
-        print("\n🤔 Would you like to perform an actual sync? (y/N): ", end="")
-        response = input().strip().lower()
+        print("\n🤔 Would you like to perform an actual sync? (y/N): ", end="", flush=True)
+        response = (await asyncio.to_thread(input)).strip().lower()
         
         if response in ['y', 'yes']:
+            try:
+                plan = await precompute_task
+            except Exception as e:
+                # The head start was only an optimisation; work the plan out now
+                print(f"⚠️  Precomputing the sync plan failed ({e}); retrying")
+                plan = await syncer.dry_run_plan()
+            print("\n📝 Unmapped items to consider:")
+            print(f"  Issues GitHub → Radicle: {plan['issues_gh_to_rad']}")
+            print(f"  Issues Radicle → GitHub: {plan['issues_rad_to_gh']}")
+            print(f"  Patches GitHub → Radicle: {plan['patches_gh_to_rad']}")
+            print(f"  Patches Radicle → GitHub: {plan['patches_rad_to_gh']}")
+            
             print("\n🔄 Performing sync...")
             results = await syncer.sync_all()
             
@@ -91,6 +123,10 @@ async def demo_sync():
             
             print(f"\n🎉 Sync completed at {datetime.now().isoformat()}")
         else:
+            precompute_task.cancel()
+            # Collect its outcome so an earlier failure isn't reported as never retrieved
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await precompute_task
             print("\n✅ Demo completed (no sync performed)")
         
     except ImportError:
@@ -100,7 +136,10 @@ async def demo_sync():
         print(f"❌ Error during demo: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        if syncer is not None:
+            await syncer.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(demo_sync())
+    entrypoint.run(demo_sync())
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Shared entrypoint glue for the async scripts in this repository.
+"""
+
+import asyncio
+import sys
+from typing import Any, Coroutine
+
+try:
+    import uvloop
+except ImportError:  # optional: pip install radicle-mcp[fast]
+    uvloop = None
+
+
+def run(main: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a script's main coroutine.
+    
+    From synchronous code this is asyncio.run, on a uvloop event loop when
+    uvloop is installed. If an event loop is already
+    running (the script was imported by an async program or test), the
+    coroutine is scheduled on that loop instead of tearing it down, and the
+    resulting task is returned for the caller to await.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        if uvloop is None:
+            return asyncio.run(main)
+        if sys.version_info >= (3, 11):
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                return runner.run(main)
+        uvloop.install()
+        return asyncio.run(main)
+    return asyncio.ensure_future(main)
@@ -9,15 +9,99 @@ between GitHub and Radicle with idempotent operations to prevent duplication.
 import asyncio
 import json
 import os
+import random
 import re
+import shlex
+import signal
+import stat
 import subprocess
-from dataclasses import dataclass, asdict
+import time
+import uuid
+from dataclasses import dataclass, asdict, fields
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union, Any
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
-import requests
+import aiohttp
+
+import _bootstrap  # noqa: F401  (puts src/ on sys.path if needed)
+from radicle_mcp.rad import rad_binary
+
+try:
+    import orjson
+except ImportError:  # optional: pip install radicle-mcp[fast]
+    orjson = None
+
+# Seconds a rad subprocess or GitHub request may take before it is abandoned
+RAD_COMMAND_TIMEOUT = 30.0
+GITHUB_REQUEST_TIMEOUT = 30.0
+
+# HTTP methods that are safe to resend after a server error
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Divider between the provenance header and the original text in synced bodies
+BODY_SEPARATOR = "---\n\n"
+NO_DESCRIPTION = "No description provided."
+
+# Radicle IDs in "✓ Issue abc123... opened" / "✓ Patch abc123... opened" output
+ISSUE_ID_RE = re.compile(rb"Issue ([a-f0-9]+)")
+PATCH_ID_RE = re.compile(rb"Patch ([a-f0-9]+)")
+# How rad rejects an option it doesn't have, e.g. `--format` on older versions
+UNKNOWN_FLAG_RE = re.compile(r"unknown|unexpected|unrecognized|invalid (?:option|argument)", re.IGNORECASE)
+# One row of the `rad issue list` table: status dot, ID, then the title up to
+# the author column (or the end of the row)
+ISSUE_ROW_RE = re.compile(r"│ ●\s+([0-9a-f]+)\s+(.*?)\s*(?:vscode|you\)|Author|│\s*$|$)")
+
+# Issue and pull request counts in a single GraphQL round-trip; a null
+# states list means every state
+COUNTS_QUERY = """
+query($owner: String!, $name: String!, $issueStates: [IssueState!], $prStates: [PullRequestState!]) {
+  repository(owner: $owner, name: $name) {
+    issues(states: $issueStates) { totalCount }
+    pullRequests(states: $prStates) { totalCount }
+  }
+}
+"""
+
+# REST state filter -> GraphQL (issue states, pull request states)
+GRAPHQL_STATES: Dict[str, Tuple[Optional[List[str]], Optional[List[str]]]] = {
+    "open": (["OPEN"], ["OPEN"]),
+    "closed": (["CLOSED"], ["CLOSED", "MERGED"]),
+    "all": (None, None),
+}
+
+# The four sync passes, in the order sync_all reports them
+SYNC_PASSES = ("issues_gh_to_rad", "issues_rad_to_gh", "patches_gh_to_rad", "patches_rad_to_gh")
+
+
+async def gather_bounded(limit: int, *aws: Awaitable[Any]) -> List[Any]:
+    """Like ``asyncio.gather``, but with at most ``limit`` awaitables running at once."""
+    semaphore = asyncio.BoundedSemaphore(limit)
+    
+    async def guarded(aw: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await aw
+    
+    return await asyncio.gather(*(guarded(aw) for aw in aws))
+
+
+def iso_to_epoch(value: str) -> int:
+    """Parse an ISO 8601 timestamp, including GitHub's trailing 'Z', to UNIX seconds."""
+    return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+
+
+def loads_json(raw: Union[str, bytes]) -> Any:
+    """Decode JSON with orjson when it is installed, else the stdlib parser."""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def new_github_session() -> aiohttp.ClientSession:
+    """Create a keep-alive HTTP session suited to api.github.com."""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit_per_host=16, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=GITHUB_REQUEST_TIMEOUT)
+    )
 
 
 @dataclass
@@ -28,7 +112,7 @@ class IssueMapping:
     radicle_id: str
     title: str
     last_sync: str
-    github_updated_at: str
+    github_updated_at: int  # UNIX seconds
     radicle_updated_at: str
 
 
@@ -40,94 +124,428 @@ class PatchMapping:
     radicle_id: str
     title: str
     last_sync: str
-    github_updated_at: str
+    github_updated_at: int  # UNIX seconds
     radicle_updated_at: str
 
 
+# Column names of the mapping tables; IssueMapping and PatchMapping share them
+MAPPING_COLUMNS = tuple(field.name for field in fields(IssueMapping))
+# On-disk layout of the database file; see SyncDatabase
+SCHEMA_VERSION = 2
+
+
+def hc_encode(columns: Dict[str, List[Any]]) -> List[Any]:
+    """
+    Flatten a column table to ``[n, name_1..name_n, row_1 values, row_2 values, ...]``.
+    
+    This homogeneous-collection layout names each field once for the whole
+    table, so the file carries no per-row keys or nested lists.
+    """
+    names = list(columns)
+    flat: List[Any] = [len(names), *names]
+    for row in zip(*columns.values()):
+        flat.extend(row)
+    return flat
+
+
+def hc_revive(flat: List[Any]) -> Dict[str, List[Any]]:
+    """Rebuild the column table that ``hc_encode`` flattened."""
+    width = flat[0]
+    names = flat[1:width + 1]
+    values = flat[width + 1:]
+    return {name: values[i::width] for i, name in enumerate(names)}
+
+
 class SyncDatabase:
-    """Simple JSON-based database for tracking sync mappings."""
+    """
+    Simple JSON-based database for tracking sync mappings.
+    
+    Issue and patch mappings are held column-wise: ``data["issues"]`` maps
+    each field name to a list, and row ``i`` of every list is one mapping.
+    On disk each table is written in the ``hc_encode`` layout under
+    ``issues_hc`` / ``patches_hc``, with ``"v": 2`` marking the schema.
+    """
     
     def __init__(self, db_path: str = ".radicle_github_sync.json"):
         self.db_path = Path(db_path)
+        self._load()
+    
+    def _load(self):
+        """(Re)load the file and rebuild the indexes, dropping unsaved changes."""
+        # The file's modification time as of our last load or save
+        self._mtime = self._disk_mtime()
         self.data = self._load_db()
+        # Set when self.data has changes that are not yet on disk
+        self._dirty = False
+        # Mapping row numbers by GitHub ID and by Radicle ID, per kind
+        self._by_github_id: Dict[str, Dict[int, int]] = {}
+        self._by_radicle_id: Dict[str, Dict[str, int]] = {}
+        for kind in ("issues", "patches"):
+            columns = self.data[kind] = self._to_columns(self.data[kind])
+            self._by_github_id[kind] = {gid: row for row, gid in enumerate(columns["github_id"])}
+            self._by_radicle_id[kind] = {rid: row for row, rid in enumerate(columns["radicle_id"])}
+    
+    def _disk_mtime(self) -> Optional[int]:
+        """Modification time of the database file in nanoseconds, or None if there is none."""
+        try:
+            return self.db_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+    
+    def reload_if_changed(self) -> bool:
+        """
+        Re-read the file if something else has written it since we loaded or saved it.
+        
+        A long-lived instance calls this before syncing so it doesn't work
+        from, and then overwrite, mappings stored by another process (such
+        as sync_cli.py). Returns whether it reloaded.
+        """
+        if self._disk_mtime() == self._mtime:
+            return False
+        self._load()
+        return True
+    
+    @staticmethod
+    def _to_columns(table: Dict[str, Any]) -> Dict[str, List[Any]]:
+        """Bring a mapping table from any earlier on-disk layout to the current one."""
+        if not isinstance(table.get("github_id"), list):
+            # Databases that stored one record per "gh<id>_rad<id>" key
+            records = list(table.values())
+            table = {name: [record[name] for record in records] for name in MAPPING_COLUMNS}
+        # Databases written before timestamps were stored as integers
+        table["github_updated_at"] = [
+            iso_to_epoch(value) if isinstance(value, str) else value
+            for value in table["github_updated_at"]
+        ]
+        return table
     
     def _load_db(self) -> Dict[str, Any]:
         """Load database from JSON file."""
         if self.db_path.exists():
             try:
-                with open(self.db_path, 'r') as f:
-                    return json.load(f)
+                data = loads_json(self.db_path.read_bytes())
             except (json.JSONDecodeError, FileNotFoundError):
                 pass
+            else:
+                if data.pop("v", 1) >= 2:
+                    for kind in ("issues", "patches"):
+                        data[kind] = hc_revive(data.pop(f"{kind}_hc"))
+                return data
         
         return {
-            "issues": {},
-            "patches": {},
+            "issues": {name: [] for name in MAPPING_COLUMNS},
+            "patches": {name: [] for name in MAPPING_COLUMNS},
             "last_sync": None,
+            "last_synced_through": None,
+            "etags": {"issues": None, "pulls": None},
             "github_repo": None,
             "radicle_rid": None
         }
     
     def save_db(self):
-        """Save database to JSON file."""
-        with open(self.db_path, 'w') as f:
-            json.dump(self.data, f, indent=2)
-    
-    def get_issue_mapping(self, github_id: Optional[int] = None, radicle_id: Optional[str] = None) -> Optional[IssueMapping]:
-        """Get issue mapping by GitHub ID or Radicle ID."""
-        for mapping_data in self.data["issues"].values():
-            mapping = IssueMapping(**mapping_data)
-            if (github_id and mapping.github_id == github_id) or \
-               (radicle_id and mapping.radicle_id == radicle_id):
-                return mapping
-        return None
+        """Save database to JSON file, atomically replacing the previous version."""
+        # The temp file lives beside the database so os.replace stays on one filesystem
+        on_disk: Dict[str, Any] = {"v": SCHEMA_VERSION}
+        for key, value in self.data.items():
+            if key in ("issues", "patches"):
+                on_disk[f"{key}_hc"] = hc_encode(value)
+            else:
+                on_disk[key] = value
+        
+        if orjson:
+            encoded = orjson.dumps(on_disk, option=orjson.OPT_INDENT_2)
+        else:
+            encoded = json.dumps(on_disk, indent=2).encode()
+        # Created like open() would (0666 less the umask), then given the
+        # existing database's mode, if any, so a save doesn't change it
+        temp_path = self.db_path.with_name(f"{self.db_path.name}.{uuid.uuid4().hex}.tmp")
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(encoded)
+            try:
+                os.chmod(temp_path, stat.S_IMODE(os.stat(self.db_path).st_mode))
+            except FileNotFoundError:
+                pass
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        os.replace(temp_path, self.db_path)
+        self._mtime = self._disk_mtime()
+        self._dirty = False
+    
+    async def flush(self):
+        """Write pending changes to disk, if there are any, without blocking the event loop."""
+        if self._dirty:
+            await asyncio.to_thread(self.save_db)
+    
+    def set(self, key: str, value: Any):
+        """Set a top-level database field; it is written on the next flush, if it changed."""
+        if self.data.get(key, self) != value:
+            self.data[key] = value
+            self._dirty = True
+    
+    def set_etag(self, resource: str, etag: Optional[str]):
+        """Record the ETag of a listing ('issues' or 'pulls'); it is written on the next flush, if it changed."""
+        etags = self.data.setdefault("etags", {})
+        if etags.get(resource, self) != etag:
+            etags[resource] = etag
+            self._dirty = True
+    
+    def count(self, kind: str) -> int:
+        """Number of stored mappings of a kind ('issues' or 'patches')."""
+        return len(self.data[kind]["github_id"])
+    
+    def _find_row(self, kind: str, github_id: Optional[int], radicle_id: Optional[str]) -> Optional[int]:
+        """Row of the mapping matching either ID, or None."""
+        row = self._by_github_id[kind].get(github_id) if github_id else None
+        if row is None and radicle_id:
+            row = self._by_radicle_id[kind].get(radicle_id)
+        return row
+    
+    def _get_row(self, kind: str, row: Optional[int]) -> Optional[Dict[str, Any]]:
+        """One mapping as a dict, or None."""
+        if row is None:
+            return None
+        return {name: values[row] for name, values in self.data[kind].items()}
+    
+    def _store(self, kind: str, record: Dict[str, Any]):
+        """Store a mapping record and index it; it is written on the next flush."""
+        columns = self.data[kind]
+        row = self._by_github_id[kind].get(record["github_id"])
+        if row is None:
+            row = len(columns["github_id"])
+            for name in MAPPING_COLUMNS:
+                columns[name].append(record[name])
+        else:
+            for name in MAPPING_COLUMNS:
+                columns[name][row] = record[name]
+        self._by_github_id[kind][record["github_id"]] = row
+        self._by_radicle_id[kind][record["radicle_id"]] = row
+        self._dirty = True
+    
+    def github_updated_at(self, kind: str) -> Dict[int, int]:
+        """``github_updated_at`` of every stored mapping of a kind, keyed by GitHub ID."""
+        columns = self.data[kind]
+        return dict(zip(columns["github_id"], columns["github_updated_at"]))
+    
+    def get_issue_mapping(self, github_id: Optional[int] = None, radicle_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Get issue mapping as a dict by GitHub ID or Radicle ID."""
+        return self._get_row("issues", self._find_row("issues", github_id, radicle_id))
     
     def save_issue_mapping(self, mapping: IssueMapping):
-        """Save issue mapping."""
-        key = f"gh{mapping.github_id}_rad{mapping.radicle_id}"
-        self.data["issues"][key] = asdict(mapping)
-        self.save_db()
-    
-    def get_patch_mapping(self, github_id: Optional[int] = None, radicle_id: Optional[str] = None) -> Optional[PatchMapping]:
-        """Get patch mapping by GitHub ID or Radicle ID."""
-        for mapping_data in self.data["patches"].values():
-            mapping = PatchMapping(**mapping_data)
-            if (github_id and mapping.github_id == github_id) or \
-               (radicle_id and mapping.radicle_id == radicle_id):
-                return mapping
-        return None
+        """Save issue mapping; it is written on the next flush."""
+        self._store("issues", asdict(mapping))
+    
+    def get_patch_mapping(self, github_id: Optional[int] = None, radicle_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Get patch mapping as a dict by GitHub ID or Radicle ID."""
+        return self._get_row("patches", self._find_row("patches", github_id, radicle_id))
     
     def save_patch_mapping(self, mapping: PatchMapping):
-        """Save patch mapping."""
-        key = f"gh{mapping.github_id}_rad{mapping.radicle_id}"
-        self.data["patches"][key] = asdict(mapping)
-        self.save_db()
+        """Save patch mapping; it is written on the next flush."""
+        self._store("patches", asdict(mapping))
+
+
+class TokenBucketRateLimiter:
+    """
+    Token bucket shaped by GitHub's ``X-RateLimit-*`` response headers.
+    
+    Requests run freely until only ``reserve`` calls remain in the current
+    window; the bucket then refills so those last calls are spread evenly
+    until the reset time, instead of bursting into 403s.
+    """
+    
+    def __init__(self, reserve: int = 50, max_wait: float = 60.0):
+        self.reserve = reserve
+        self.max_wait = max_wait
+        # Unthrottled until GitHub has told us where we stand
+        self.tokens = float("inf")
+        self.rate = 0.0
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def update(self, headers: Any):
+        """Reshape the bucket from a response's rate-limit headers."""
+        # GraphQL and search have their own quotas; pace only the core REST one
+        if headers.get("X-RateLimit-Resource", "core") != "core":
+            return
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        
+        remaining = int(remaining)
+        paced = min(remaining, self.reserve)
+        self.tokens = float(remaining - paced)
+        self.rate = paced / max(float(reset) - time.time(), 1.0)
+        self.updated = time.monotonic()
+    
+    async def acquire(self):
+        """Take a token, sleeping until one is available."""
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens += (now - self.updated) * self.rate
+            self.updated = now
+            if self.tokens < 1.0 and self.rate > 0:
+                # Waits too long to sit out are left to fail fast at GitHub
+                wait = (1.0 - self.tokens) / self.rate
+                if wait <= self.max_wait:
+                    await asyncio.sleep(wait)
+                    self.tokens = 1.0
+                    self.updated = time.monotonic()
+            self.tokens -= 1.0
 
 
 class GitHubAPI:
-    """GitHub API wrapper for sync operations."""
+    """Async GitHub API wrapper for sync operations."""
     
-    def __init__(self, token: str, repo: str):
+    # Upper bound on page requests in flight for a single list call
+    max_concurrent_pages = 8
+    # Retries for rate-limited (403/429) and server-error (5xx) responses, and
+    # the longest wait we are willing to sit out before giving up instead
+    max_retries = 3
+    max_retry_wait = 60.0
+    
+    def __init__(self, token: str, repo: str, session: Optional[aiohttp.ClientSession] = None):
         self.token = token
         self.repo = repo  # format: "owner/repo"
         self.headers = {
-            "Authorization": f"token {token}",
-            "Accept": "application/vnd.github.v3+json"
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json"
         }
         self.base_url = "https://api.github.com"
+        # A session passed in by the caller is shared and stays open on close()
+        self._session = session
+        self._owns_session = session is None
+        # ETag of the last full listing per endpoint ('issues', 'pulls')
+        self.etags: Dict[str, str] = {}
+        self.rate_limiter = TokenBucketRateLimiter(max_wait=self.max_retry_wait)
     
-    def get_issues(self, state: str = "all") -> List[Dict[str, Any]]:
-        """Get issues from GitHub repository."""
-        url = f"{self.base_url}/repos/{self.repo}/issues"
-        params: Dict[str, Union[str, int]] = {"state": state, "per_page": 100}
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """HTTP session shared by all requests, created lazily on the running loop."""
+        if self._session is None or self._session.closed:
+            self._session = new_github_session()
+            self._owns_session = True
+        return self._session
+    
+    async def close(self):
+        """Close the underlying HTTP session if this instance created it."""
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+    
+    async def __aenter__(self) -> "GitHubAPI":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any):
+        await self.close()
+    
+    def _retry_delay(self, method: str, response: aiohttp.ClientResponse, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying a throttled or failed response, or None if it should not be retried."""
+        if response.status in (500, 502, 503, 504):
+            # The write may have happened before the error; resending a POST
+            # could create a duplicate
+            if method.upper() not in IDEMPOTENT_METHODS:
+                return None
+        elif response.status not in (403, 429):
+            return None
+        
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            return float(retry_after)
         
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = response.headers.get("X-RateLimit-Reset")
+            if reset is not None:
+                return max(float(reset) - time.time(), 0.0) + 1.0
+        
+        # A 403 without rate-limit headers is a permission problem, not throttling
+        if response.status == 403:
+            return None
+        # Jitter keeps concurrent page fetches from retrying in lockstep
+        return 2 ** attempt + random.uniform(0, 1)
+    
+    async def _request(self, method: str, url: str, **kwargs: Any) -> Tuple[Any, aiohttp.ClientResponse]:
+        """
+        Send a request and return its decoded JSON body along with the response.
+        
+        Requests are paced by the rate limiter. Rate-limited responses, and 5xx
+        responses to idempotent methods, are retried after the delay GitHub asks for (``Retry-After`` /
+        ``X-RateLimit-Reset``), falling back to exponential backoff. A 304 Not Modified answer to a conditional request has no
+        body and is returned as None.
+        """
+        headers = {**self.headers, **kwargs.pop("headers", {})}
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire()
+            async with self.session.request(method, url, headers=headers, **kwargs) as response:
+                self.rate_limiter.update(response.headers)
+                delay = self._retry_delay(method, response, attempt)
+                if delay is None or delay > self.max_retry_wait or attempt >= self.max_retries:
+                    response.raise_for_status()
+                    if response.status == 304:
+                        return None, response
+                    return await response.json(), response
+            attempt += 1
+            await asyncio.sleep(delay)
+    
+    async def _paginated_get(self, path: str, params: Dict[str, Union[str, int]],
+                             etag: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch every page of a list endpoint.
+        
+        The first page is requested on its own to learn the page count from the
+        ``Link: rel="last"`` header; the remaining pages are then fetched
+        concurrently, bounded to stay under GitHub's secondary rate limit.
+        
+        With ``etag``, the first page is requested conditionally and None is
+        returned if GitHub answers 304, which costs no rate limit. Listings
+        are sorted by last update, so any change to any item changes page one.
+        """
+        url = f"{self.base_url}{path}"
+        params = {**params, "sort": "updated", "direction": "desc", "per_page": 100, "page": 1}
+        headers = {"If-None-Match": etag} if etag else {}
+        
+        items, response = await self._request("GET", url, params=params, headers=headers)
+        if response.status == 304:
+            return None
+        if "ETag" in response.headers:
+            self.etags[path.rsplit("/", 1)[-1]] = response.headers["ETag"]
+        last = response.links.get("last")
+        
+        if last is None:
+            return items
+        
+        last_page = int(last["url"].query.get("page", 1))
+        pages = await gather_bounded(
+            self.max_concurrent_pages,
+            *(self._request("GET", url, params={**params, "page": page}) for page in range(2, last_page + 1))
+        )
+        for page_items, _ in pages:
+            items.extend(page_items)
+        return items
+    
+    async def get_issues(self, state: str = "all", since: Optional[str] = None,
+                         etag: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get issues from GitHub repository.
+        
+        Args:
+            state: Issue state filter ('open', 'closed' or 'all')
+            since: Only return issues updated at or after this ISO 8601 timestamp
+            etag: ETag of a previous listing; None is returned if nothing changed
+        """
+        params: Dict[str, Union[str, int]] = {"state": state}
+        if since:
+            params["since"] = since
+        issues = await self._paginated_get(f"/repos/{self.repo}/issues", params, etag)
+        if issues is None:
+            return None
         
         # Filter out pull requests (GitHub API includes PRs in issues)
-        return [issue for issue in response.json() if not issue.get("pull_request")]
+        return [issue for issue in issues if not issue.get("pull_request")]
     
-    def create_issue(self, title: str, body: str, labels: Optional[List[str]] = None) -> Dict[str, Any]:
+    async def create_issue(self, title: str, body: str, labels: Optional[List[str]] = None) -> Dict[str, Any]:
         """Create a new issue on GitHub."""
         url = f"{self.base_url}/repos/{self.repo}/issues"
         data: Dict[str, Any] = {
@@ -136,12 +554,11 @@ class GitHubAPI:
             "labels": labels or []
         }
         
-        response = requests.post(url, headers=self.headers, json=data)
-        response.raise_for_status()
-        return response.json()
+        issue, _ = await self._request("POST", url, json=data)
+        return issue
     
-    def update_issue(self, issue_number: int, title: Optional[str] = None, body: Optional[str] = None, 
-                    state: Optional[str] = None, labels: Optional[List[str]] = None) -> Dict[str, Any]:
+    async def update_issue(self, issue_number: int, title: Optional[str] = None, body: Optional[str] = None, 
+                           state: Optional[str] = None, labels: Optional[List[str]] = None) -> Dict[str, Any]:
         """Update an existing GitHub issue."""
         url = f"{self.base_url}/repos/{self.repo}/issues/{issue_number}"
         data: Dict[str, Any] = {}
@@ -155,146 +572,288 @@ class GitHubAPI:
         if labels is not None:
             data["labels"] = labels
         
-        response = requests.patch(url, headers=self.headers, json=data)
-        response.raise_for_status()
-        return response.json()
+        issue, _ = await self._request("PATCH", url, json=data)
+        return issue
+    
+    async def get_pull_requests(self, state: str = "all",
+                                etag: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """Get pull requests from GitHub repository; None if ``etag`` is still current."""
+        return await self._paginated_get(f"/repos/{self.repo}/pulls", {"state": state}, etag)
+    
+    async def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run a GraphQL query and return its ``data``, raising on GraphQL errors."""
+        url = f"{self.base_url}/graphql"
+        result, _ = await self._request("POST", url, json={"query": query, "variables": variables or {}})
+        if result.get("errors"):
+            raise RuntimeError(f"GitHub GraphQL error: {result['errors'][0].get('message')}")
+        return result["data"]
     
-    def get_pull_requests(self, state: str = "all") -> List[Dict[str, Any]]:
-        """Get pull requests from GitHub repository."""
-        url = f"{self.base_url}/repos/{self.repo}/pulls"
-        params: Dict[str, Union[str, int]] = {"state": state, "per_page": 100}
+    async def count_items(self, state: str = "all") -> Tuple[int, int]:
+        """
+        Count issues and pull requests in a state ('open', 'closed' or 'all').
         
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        Uses one GraphQL request instead of walking REST pagination; tokens
+        that cannot use GraphQL fall back to listing through REST.
+        """
+        owner, name = self.repo.split("/", 1)
+        issue_states, pr_states = GRAPHQL_STATES[state]
+        variables = {"owner": owner, "name": name, "issueStates": issue_states, "prStates": pr_states}
+        try:
+            data = await self.graphql(COUNTS_QUERY, variables)
+            repository = data["repository"]
+            return repository["issues"]["totalCount"], repository["pullRequests"]["totalCount"]
+        except (aiohttp.ClientResponseError, RuntimeError, KeyError, TypeError):
+            issues, pull_requests = await asyncio.gather(
+                self.get_issues(state=state),
+                self.get_pull_requests(state=state)
+            )
+            return len(issues), len(pull_requests)
 
 
 class RadicleAPI:
     """Radicle CLI wrapper for sync operations."""
     
-    async def run_command(self, command: List[str], cwd: str = ".") -> Dict[str, Any]:
-        """Run a rad command and return the result."""
+    # Upper bound on rad processes running at once for one batch of work
+    max_concurrent_commands = 8
+    
+    def __init__(self):
+        # Cleared once rad rejects --format json on list commands
+        self.json_lists = True
+    
+    async def run_command(self, command: List[str], cwd: str = ".",
+                          timeout: float = RAD_COMMAND_TIMEOUT, decode: bool = True) -> Dict[str, Any]:
+        """
+        Run a rad command and return the result.
+        
+        With ``decode=False`` stdout is returned as raw bytes, for callers
+        that only pattern-match or JSON-parse it. If the command times out
+        it is killed, and stdout holds what it printed before then.
+        """
+        empty = "" if decode else b""
         try:
+            if command[0] == "rad":
+                command = [rad_binary(), *command[1:]]
             process = await asyncio.create_subprocess_exec(
                 *command,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                cwd=cwd
+                cwd=cwd,
+                # Its own process group, so a timeout also kills whatever a
+                # shell script (see create_issues_bulk) was running
+                start_new_session=True
             )
             
-            stdout, stderr = await process.communicate()
+            # Read into buffers rather than via communicate() so the output
+            # so far survives a timeout
+            stdout, stderr = bytearray(), bytearray()
+            
+            async def drain(stream: asyncio.StreamReader, buffer: bytearray):
+                while chunk := await stream.read(65536):
+                    buffer += chunk
+            
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(drain(process.stdout, stdout), drain(process.stderr, stderr), process.wait()),
+                    timeout
+                )
+            except asyncio.TimeoutError:
+                if hasattr(os, "killpg"):
+                    os.killpg(process.pid, signal.SIGKILL)
+                else:
+                    process.kill()
+                await process.wait()
+                partial = bytes(stdout).strip()
+                return {
+                    "stdout": partial.decode("utf-8", "replace") if decode else partial,
+                    "stderr": f"Command timed out after {timeout:g}s",
+                    "return_code": 124,
+                    "success": False
+                }
             
             return {
-                "stdout": stdout.decode("utf-8").strip(),
+                "stdout": stdout.decode("utf-8").strip() if decode else bytes(stdout).strip(),
                 "stderr": stderr.decode("utf-8").strip(),
                 "return_code": process.returncode,
                 "success": process.returncode == 0
             }
         except Exception as e:
             return {
-                "stdout": "",
+                "stdout": empty,
                 "stderr": str(e),
                 "return_code": 1,
                 "success": False
             }
     
+    async def _list_json(self, kind: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        List issues or patches via ``rad <kind> list --format json``.
+        
+        Returns None when the call fails, so the caller falls back to the
+        table parser. Only an unknown-flag error, meaning the installed rad
+        only prints tables, is remembered for later calls.
+        """
+        if not self.json_lists:
+            return None
+        
+        result = await self.run_command(["rad", kind, "list", "--format", "json"], decode=False)
+        if result["success"]:
+            try:
+                records = loads_json(result["stdout"] or b"[]")
+                return [self._from_json(record) for record in records]
+            except (ValueError, TypeError, AttributeError, KeyError):
+                return None
+        if UNKNOWN_FLAG_RE.search(result["stderr"]):
+            self.json_lists = False
+        return None
+    
+    @staticmethod
+    def _from_json(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape a JSON issue/patch record like the table parser's output."""
+        author = record.get("author")
+        if isinstance(author, dict):
+            author = author.get("alias") or author.get("id")
+        timestamp = record.get("timestamp") or record.get("created_at")
+        return {
+            "id": record["id"],
+            "title": record.get("title", ""),
+            "author": author or "unknown",
+            "created_at": str(timestamp or "unknown"),
+            "updated_at": str(record.get("updated_at") or timestamp or "unknown"),
+            "description": record.get("description") or record.get("body") or ""
+        }
+    
     async def get_issues(self) -> List[Dict[str, Any]]:
         """Get issues from Radicle repository."""
-        result = await self.run_command(["rad", "issue", "list"])
+        issues = await self._list_json("issue")
+        if issues is not None:
+            return issues
         
+        result = await self.run_command(["rad", "issue", "list"])
         if result["success"] and result["stdout"]:
-            # Parse the table output since --format json is not available
-            issues = []
-            lines = result["stdout"].split('\n')
-            
-            for line in lines:
-                # Look for issue lines (start with │ ● and have an ID)
-                if '│ ●' in line and len(line.split()) >= 3:
-                    parts = line.split()
-                    # Find the ID (should be after ●)
-                    try:
-                        id_index = parts.index('●') + 1
-                        if id_index < len(parts):
-                            issue_id = parts[id_index]
-                            # Try to extract title (everything between ID and Author)
-                            # This is a basic parser - in a real implementation you'd want more robust parsing
-                            title_start = line.find(issue_id) + len(issue_id)
-                            author_keywords = ['vscode', 'you)', 'Author']
-                            title_end = len(line)
-                            for keyword in author_keywords:
-                                pos = line.find(keyword, title_start)
-                                if pos > title_start:
-                                    title_end = pos
-                                    break
-                            
-                            title = line[title_start:title_end].strip()
-                            
-                            issues.append({
-                                "id": issue_id,
-                                "title": title,
-                                "author": "vscode",  # Extracted from the table
-                                "created_at": "unknown",  # Not available in table format
-                                "updated_at": "unknown",
-                                "description": "No description available from list format"
-                            })
-                    except (ValueError, IndexError):
-                        continue
-            
-            return issues
+            return self._parse_issue_table(result["stdout"])
         return []
     
-    async def create_issue(self, title: str, description: str, labels: Optional[List[str]] = None) -> Optional[str]:
-        """Create a new issue in Radicle repository."""
+    @staticmethod
+    def _parse_issue_table(stdout: str) -> List[Dict[str, Any]]:
+        """Parse the table printed by rad versions without JSON list output."""
+        return [
+            {
+                "id": match.group(1),
+                "title": match.group(2),
+                "author": "vscode",  # Extracted from the table
+                "created_at": "unknown",  # Not available in table format
+                "updated_at": "unknown",
+                "description": "No description available from list format"
+            }
+            for match in map(ISSUE_ROW_RE.search, stdout.split('\n'))
+            if match
+        ]
+
+    @staticmethod
+    def _issue_open_command(title: str, description: str, labels: Optional[List[str]] = None) -> List[str]:
+        """Build the ``rad issue open`` command line for one issue."""
         command = ["rad", "issue", "open", "--title", title, "--description", description]
         
         if labels:
             for label in labels:
                 command.extend(["--label", label])
         
-        result = await self.run_command(command)
+        return command
+    
+    async def create_issue(self, title: str, description: str, labels: Optional[List[str]] = None) -> Optional[str]:
+        """Create a new issue in Radicle repository."""
+        result = await self.run_command(self._issue_open_command(title, description, labels), decode=False)
         
         if result["success"]:
             # Extract issue ID from output
             # Format is typically "✓ Issue abc123... opened"
-            match = re.search(r"Issue ([a-f0-9]+)", result["stdout"])
+            match = ISSUE_ID_RE.search(result["stdout"])
             if match:
-                return match.group(1)
+                return match.group(1).decode()
         
         return None
     
+    async def create_issues_bulk(self, items: List[Tuple[str, str, List[str]]]) -> List[Optional[str]]:
+        """
+        Create several issues with one shell process instead of one per issue.
+        
+        ``items`` are ``(title, description, labels)`` tuples; the result holds
+        each new issue ID (or None on failure) in the same order. Each
+        ``rad issue open`` is followed by a separator line so a failing item
+        does not shift the IDs of the ones after it. If the script could not
+        start at all, the items are created individually, a few at a time.
+        If it stopped partway (e.g. timed out), the IDs rad printed before
+        then are still returned, so those issues get mappings and aren't
+        created again next time; only items with no ID are reported as
+        failed, and they are not retried here in case rad created them anyway.
+        """
+        if len(items) <= 1:
+            return [await self.create_issue(*item) for item in items]
+        
+        separator = f"--- radicle-mcp {uuid.uuid4().hex} ---"
+        script = "\n".join(
+            f"{shlex.join(self._issue_open_command(*item))}; echo {shlex.quote(separator)}"
+            for item in items
+        )
+        result = await self.run_command(["sh", "-c", script], timeout=RAD_COMMAND_TIMEOUT * len(items), decode=False)
+        
+        sections = result["stdout"].split(separator.encode())
+        finished = len(sections) - 1
+        if finished == 0 and not result["stdout"] and result["return_code"] != 124:
+            return await gather_bounded(
+                self.max_concurrent_commands,
+                *(self.create_issue(*item) for item in items)
+            )
+        
+        # The last section belongs to the item that was running when the
+        # script stopped (empty if it ran to the end); rad may already have
+        # reported its ID
+        radicle_ids: List[Optional[str]] = []
+        for section in sections[:len(items)]:
+            match = ISSUE_ID_RE.search(section)
+            radicle_ids.append(match.group(1).decode() if match else None)
+        radicle_ids.extend([None] * (len(items) - len(radicle_ids)))
+        return radicle_ids
+    
     async def get_patches(self) -> List[Dict[str, Any]]:
         """Get patches from Radicle repository."""
-        result = await self.run_command(["rad", "patch", "list"])
+        patches = await self._list_json("patch")
+        if patches is not None:
+            return patches
         
+        result = await self.run_command(["rad", "patch", "list"])
         if result["success"] and result["stdout"]:
-            # Parse the table output since --format json may not be available
-            patches = []
-            lines = result["stdout"].split('\n')
-            
-            for line in lines:
-                # Look for patch lines (similar to issues)
-                if '│' in line and len(line.split()) >= 3:
-                    # Basic parsing - would need enhancement for production use
-                    parts = line.split()
-                    if len(parts) > 2:
-                        try:
-                            # Try to extract patch ID and title
-                            patch_id = parts[1] if parts[1] != '│' else parts[2]
-                            title = " ".join(parts[3:5]) if len(parts) > 4 else "Unknown patch"
-                            
-                            patches.append({
-                                "id": patch_id,
-                                "title": title,
-                                "author": "unknown",
-                                "created_at": "unknown",
-                                "updated_at": "unknown",
-                                "description": "No description available from list format"
-                            })
-                        except (ValueError, IndexError):
-                            continue
-            
-            return patches
+            return self._parse_patch_table(result["stdout"])
         return []
+    
+    @staticmethod
+    def _parse_patch_table(stdout: str) -> List[Dict[str, Any]]:
+        """Parse the table printed by rad versions without JSON list output."""
+        patches = []
+        
+        for line in stdout.split('\n'):
+            # Look for patch lines (similar to issues)
+            if '│' in line and len(line.split()) >= 3:
+                # Basic parsing - would need enhancement for production use
+                parts = line.split()
+                if len(parts) > 2:
+                    try:
+                        # Try to extract patch ID and title
+                        patch_id = parts[1] if parts[1] != '│' else parts[2]
+                        title = " ".join(parts[3:5]) if len(parts) > 4 else "Unknown patch"
+                        
+                        patches.append({
+                            "id": patch_id,
+                            "title": title,
+                            "author": "unknown",
+                            "created_at": "unknown",
+                            "updated_at": "unknown",
+                            "description": "No description available from list format"
+                        })
+                    except (ValueError, IndexError):
+                        continue
+        
+        return patches
 
     async def create_patch(self, branch_name: str, title: str, description: str) -> Optional[str]:
         """Create a new patch in Radicle repository."""
@@ -305,14 +864,14 @@ class RadicleAPI:
             return None
         
         command = ["rad", "patch", "open", "--title", title, "--description", description, branch_name]
-        result = await self.run_command(command)
+        result = await self.run_command(command, decode=False)
         
         if result["success"]:
             # Extract patch ID from output
             # Format is typically "✓ Patch abc123... opened"
-            match = re.search(r"Patch ([a-f0-9]+)", result["stdout"])
+            match = PATCH_ID_RE.search(result["stdout"])
             if match:
-                return match.group(1)
+                return match.group(1).decode()
         
         return None
 
@@ -325,53 +884,92 @@ class GitHubRadicleSyncer:
         self.radicle = RadicleAPI()
         self.db = SyncDatabase()
         
-        # Update database with current repo info
-        self.db.data["github_repo"] = github_repo
+        # Record current repo info; it is written with the first flush
+        self.db.set("github_repo", github_repo)
         if radicle_rid:
-            self.db.data["radicle_rid"] = radicle_rid
-        self.db.save_db()
+            self.db.set("radicle_rid", radicle_rid)
+    
+    async def close(self):
+        """Write pending mapping changes and release the GitHub HTTP session."""
+        try:
+            await self.db.flush()
+        finally:
+            await self.github.close()
+    
+    async def __aenter__(self) -> "GitHubRadicleSyncer":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any):
+        await self.close()
+    
+    async def _list_github_issues(self) -> Optional[List[Dict[str, Any]]]:
+        """GitHub issues that may need syncing, or None if nothing changed since the last clean pass."""
+        # Only issues touched since the last clean pass can need work
+        etags = self.db.data.get("etags") or {}
+        return await self.github.get_issues(since=self.db.data.get("last_synced_through"), etag=etags.get("issues"))
+    
+    async def _list_github_prs(self) -> Optional[List[Dict[str, Any]]]:
+        """GitHub pull requests, or None if nothing changed since the last pass."""
+        etags = self.db.data.get("etags") or {}
+        return await self.github.get_pull_requests(etag=etags.get("pulls"))
     
     async def sync_issues_github_to_radicle(self) -> Dict[str, int]:
         """Sync issues from GitHub to Radicle."""
+        return await self._sync_github_issues(await self._list_github_issues())
+    
+    async def _sync_github_issues(self, github_issues: Optional[List[Dict[str, Any]]]) -> Dict[str, int]:
+        """Create Radicle issues for a listing of GitHub issues."""
         print("🔄 Syncing issues: GitHub → Radicle")
         
-        github_issues = self.github.get_issues()
+        if github_issues is None:
+            print("✅ No GitHub issue changes since the last sync")
+            return {"created": 0, "updated": 0, "skipped": 0}
+        
         created = 0
         updated = 0
         skipped = 0
+        failed = 0
         
+        # Last seen update of every mapped issue, so the loop needs no per-item lookups
+        known = self.db.github_updated_at("issues")
+        to_create = []
         for gh_issue in github_issues:
-            github_id = gh_issue["id"]
-            github_number = gh_issue["number"]
-            
             # Check if already mapped
-            existing_mapping = self.db.get_issue_mapping(github_id=github_id)
+            previous = known.get(gh_issue["id"])
             
-            if existing_mapping:
+            if previous is not None:
                 # Check if update needed
-                if gh_issue["updated_at"] > existing_mapping.github_updated_at:
-                    print(f"⚠️  Issue #{github_number} needs update (not implemented yet)")
+                if iso_to_epoch(gh_issue["updated_at"]) > previous:
+                    print(f"⚠️  Issue #{gh_issue['number']} needs update (not implemented yet)")
                     updated += 1
                 else:
                     skipped += 1
                 continue
             
-            # Create new issue in Radicle
-            title = gh_issue["title"]
-            body = self._format_issue_body_for_radicle(gh_issue)
-            labels = [label["name"] for label in gh_issue.get("labels", [])]
-            
-            radicle_id = await self.radicle.create_issue(title, body, labels)
+            to_create.append(gh_issue)
+        
+        # Create the new issues in Radicle in one batch
+        radicle_ids = await self.radicle.create_issues_bulk([
+            (
+                gh_issue["title"],
+                self._format_issue_body_for_radicle(gh_issue),
+                [label["name"] for label in gh_issue.get("labels", [])]
+            )
+            for gh_issue in to_create
+        ])
+        
+        for gh_issue, radicle_id in zip(to_create, radicle_ids):
+            github_number = gh_issue["number"]
             
             if radicle_id:
                 # Save mapping
                 mapping = IssueMapping(
-                    github_id=github_id,
+                    github_id=gh_issue["id"],
                     github_number=github_number,
                     radicle_id=radicle_id,
-                    title=title,
+                    title=gh_issue["title"],
                     last_sync=datetime.now().isoformat(),
-                    github_updated_at=gh_issue["updated_at"],
+                    github_updated_at=iso_to_epoch(gh_issue["updated_at"]),
                     radicle_updated_at=datetime.now().isoformat()
                 )
                 self.db.save_issue_mapping(mapping)
@@ -379,14 +977,24 @@ class GitHubRadicleSyncer:
                 created += 1
             else:
                 print(f"❌ Failed to create Radicle issue for GitHub #{github_number}")
+                failed += 1
+        
+        # Advance the watermark and ETag only when nothing failed, so failures are retried
+        if not failed:
+            if github_issues:
+                self.db.set("last_synced_through", max(issue["updated_at"] for issue in github_issues))
+            self.db.set_etag("issues", self.github.etags.get("issues"))
         
         return {"created": created, "updated": updated, "skipped": skipped}
     
     async def sync_issues_radicle_to_github(self) -> Dict[str, int]:
         """Sync issues from Radicle to GitHub."""
+        return await self._sync_radicle_issues(await self.radicle.get_issues())
+    
+    async def _sync_radicle_issues(self, radicle_issues: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Create GitHub issues for a listing of Radicle issues."""
         print("🔄 Syncing issues: Radicle → GitHub")
         
-        radicle_issues = await self.radicle.get_issues()
         created = 0
         updated = 0
         skipped = 0
@@ -409,7 +1017,7 @@ class GitHubRadicleSyncer:
             labels = ["from-radicle"]  # Tag to identify Radicle-originated issues
             
             try:
-                gh_issue = self.github.create_issue(title, body, labels)
+                gh_issue = await self.github.create_issue(title, body, labels)
                 
                 # Save mapping
                 mapping = IssueMapping(
@@ -418,7 +1026,7 @@ class GitHubRadicleSyncer:
                     radicle_id=radicle_id,
                     title=title,
                     last_sync=datetime.now().isoformat(),
-                    github_updated_at=gh_issue["updated_at"],
+                    github_updated_at=iso_to_epoch(gh_issue["updated_at"]),
                     radicle_updated_at=rad_issue.get("updated_at", datetime.now().isoformat())
                 )
                 self.db.save_issue_mapping(mapping)
@@ -432,23 +1040,30 @@ class GitHubRadicleSyncer:
     
     async def sync_patches_github_to_radicle(self) -> Dict[str, int]:
         """Sync pull requests from GitHub to Radicle patches."""
+        return await self._sync_github_prs(await self._list_github_prs())
+    
+    async def _sync_github_prs(self, github_prs: Optional[List[Dict[str, Any]]]) -> Dict[str, int]:
+        """Create Radicle patches for a listing of GitHub pull requests."""
         print("🔄 Syncing patches: GitHub PRs → Radicle")
         
-        github_prs = self.github.get_pull_requests()
+        if github_prs is None:
+            print("✅ No GitHub pull request changes since the last sync")
+            return {"created": 0, "updated": 0, "skipped": 0}
+        
         created = 0
         updated = 0
         skipped = 0
         
+        known = self.db.github_updated_at("patches")
         for gh_pr in github_prs:
-            github_id = gh_pr["id"]
             github_number = gh_pr["number"]
             
             # Check if already mapped
-            existing_mapping = self.db.get_patch_mapping(github_id=github_id)
+            previous = known.get(gh_pr["id"])
             
-            if existing_mapping:
+            if previous is not None:
                 # Check if update needed
-                if gh_pr["updated_at"] > existing_mapping.github_updated_at:
+                if iso_to_epoch(gh_pr["updated_at"]) > previous:
                     print(f"⚠️  PR #{github_number} needs update (not implemented yet)")
                     updated += 1
                 else:
@@ -461,26 +1076,25 @@ class GitHubRadicleSyncer:
                 skipped += 1
                 continue
             
-            # Create new patch in Radicle
-            title = gh_pr["title"]
-            body = self._format_patch_body_for_radicle(gh_pr)
-            branch_name = f"github-pr-{github_number}"
-            
             # For now, we'll skip creating actual patches since it requires branch management
             # In a real implementation, you'd need to:
             # 1. Fetch the PR branch from GitHub
-            # 2. Create a local branch
-            # 3. Create the patch
+            # 2. Create a local branch (github-pr-<number>)
+            # 3. Create the patch, with _format_patch_body_for_radicle(gh_pr) as its description
             print(f"⚠️  PR to patch sync requires branch management (PR #{github_number} skipped)")
             skipped += 1
         
+        self.db.set_etag("pulls", self.github.etags.get("pulls"))
         return {"created": created, "updated": updated, "skipped": skipped}
     
     async def sync_patches_radicle_to_github(self) -> Dict[str, int]:
         """Sync patches from Radicle to GitHub pull requests."""
+        return await self._sync_radicle_patches(await self.radicle.get_patches())
+    
+    async def _sync_radicle_patches(self, radicle_patches: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Create GitHub pull requests for a listing of Radicle patches."""
         print("🔄 Syncing patches: Radicle → GitHub PRs")
         
-        radicle_patches = await self.radicle.get_patches()
         created = 0
         updated = 0
         skipped = 0
@@ -506,62 +1120,107 @@ class GitHubRadicleSyncer:
         
         return {"created": created, "updated": updated, "skipped": skipped}
     
+    async def dry_run_plan(self) -> Dict[str, int]:
+        """Count the unmapped items a sync would consider in each direction, without changing anything."""
+        github_issues, radicle_issues, github_prs, radicle_patches = await asyncio.gather(
+            self.github.get_issues(since=self.db.data.get("last_synced_through")),
+            self.radicle.get_issues(),
+            self.github.get_pull_requests(),
+            self.radicle.get_patches()
+        )
+        
+        known_issues = self.db.github_updated_at("issues")
+        known_patches = self.db.github_updated_at("patches")
+        return {
+            "issues_gh_to_rad": sum(1 for issue in github_issues if issue["id"] not in known_issues),
+            "issues_rad_to_gh": sum(
+                1 for issue in radicle_issues
+                if issue.get("id") and not self.db.get_issue_mapping(radicle_id=issue["id"])
+            ),
+            "patches_gh_to_rad": sum(
+                1 for pr in github_prs
+                if pr["state"] == "open" and pr["id"] not in known_patches
+            ),
+            "patches_rad_to_gh": sum(
+                1 for patch in radicle_patches
+                if patch.get("id") and not self.db.get_patch_mapping(radicle_id=patch["id"])
+            )
+        }
+    
     def _format_issue_body_for_radicle(self, gh_issue: Dict[str, Any]) -> str:
         """Format GitHub issue body for Radicle."""
-        body = f"**Originally from GitHub issue #{gh_issue['number']}**\n\n"
-        body += f"Author: @{gh_issue['user']['login']}\n"
-        body += f"Created: {gh_issue['created_at']}\n"
-        body += f"GitHub URL: {gh_issue['html_url']}\n\n"
-        body += "---\n\n"
-        body += gh_issue.get("body", "") or "No description provided."
-        return body
+        return (
+            f"**Originally from GitHub issue #{gh_issue['number']}**\n\n"
+            f"Author: @{gh_issue['user']['login']}\n"
+            f"Created: {gh_issue['created_at']}\n"
+            f"GitHub URL: {gh_issue['html_url']}\n\n"
+            f"{BODY_SEPARATOR}{gh_issue.get('body', '') or NO_DESCRIPTION}"
+        )
     
     def _format_issue_body_for_github(self, rad_issue: Dict[str, Any]) -> str:
         """Format Radicle issue body for GitHub."""
-        body = f"**Originally from Radicle issue {rad_issue.get('id', 'unknown')[:8]}...**\n\n"
-        body += f"Author: {rad_issue.get('author', 'unknown')}\n"
-        body += f"Created: {rad_issue.get('created_at', 'unknown')}\n\n"
-        body += "---\n\n"
-        body += rad_issue.get("description", "") or "No description provided."
-        return body
+        return (
+            f"**Originally from Radicle issue {rad_issue.get('id', 'unknown')[:8]}...**\n\n"
+            f"Author: {rad_issue.get('author', 'unknown')}\n"
+            f"Created: {rad_issue.get('created_at', 'unknown')}\n\n"
+            f"{BODY_SEPARATOR}{rad_issue.get('description', '') or NO_DESCRIPTION}"
+        )
     
     def _format_patch_body_for_radicle(self, gh_pr: Dict[str, Any]) -> str:
         """Format GitHub PR body for Radicle patch."""
-        body = f"**Originally from GitHub PR #{gh_pr['number']}**\n\n"
-        body += f"Author: @{gh_pr['user']['login']}\n"
-        body += f"Created: {gh_pr['created_at']}\n"
-        body += f"GitHub URL: {gh_pr['html_url']}\n"
-        body += f"Base: {gh_pr['base']['ref']} ← Head: {gh_pr['head']['ref']}\n\n"
-        body += "---\n\n"
-        body += gh_pr.get("body", "") or "No description provided."
-        return body
+        return (
+            f"**Originally from GitHub PR #{gh_pr['number']}**\n\n"
+            f"Author: @{gh_pr['user']['login']}\n"
+            f"Created: {gh_pr['created_at']}\n"
+            f"GitHub URL: {gh_pr['html_url']}\n"
+            f"Base: {gh_pr['base']['ref']} ← Head: {gh_pr['head']['ref']}\n\n"
+            f"{BODY_SEPARATOR}{gh_pr.get('body', '') or NO_DESCRIPTION}"
+        )
     
     def _format_patch_body_for_github(self, rad_patch: Dict[str, Any]) -> str:
         """Format Radicle patch body for GitHub PR."""
-        body = f"**Originally from Radicle patch {rad_patch.get('id', 'unknown')[:8]}...**\n\n"
-        body += f"Author: {rad_patch.get('author', 'unknown')}\n"
-        body += f"Created: {rad_patch.get('created_at', 'unknown')}\n\n"
-        body += "---\n\n"
-        body += rad_patch.get("description", "") or "No description provided."
-        return body
-    
-    async def sync_all(self) -> Dict[str, Any]:
-        """Perform bidirectional sync of issues and patches."""
+        return (
+            f"**Originally from Radicle patch {rad_patch.get('id', 'unknown')[:8]}...**\n\n"
+            f"Author: {rad_patch.get('author', 'unknown')}\n"
+            f"Created: {rad_patch.get('created_at', 'unknown')}\n\n"
+            f"{BODY_SEPARATOR}{rad_patch.get('description', '') or NO_DESCRIPTION}"
+        )
+    
+    async def sync_all(self, passes: Iterable[str] = SYNC_PASSES) -> Dict[str, Any]:
+        """
+        Perform bidirectional sync of issues and patches.
+        
+        Args:
+            passes: Which of SYNC_PASSES to run (default: all four)
+        
+        Returns:
+            Result counts keyed by pass name
+        """
         print("🚀 Starting comprehensive GitHub ↔ Radicle sync")
         
-        results = {}
+        listings = {
+            "issues_gh_to_rad": (self._list_github_issues, self._sync_github_issues),
+            "issues_rad_to_gh": (self.radicle.get_issues, self._sync_radicle_issues),
+            "patches_gh_to_rad": (self._list_github_prs, self._sync_github_prs),
+            "patches_rad_to_gh": (self.radicle.get_patches, self._sync_radicle_patches),
+        }
+        selected = [name for name in SYNC_PASSES if name in passes]
         
-        # Sync issues both directions
-        results["issues_gh_to_rad"] = await self.sync_issues_github_to_radicle()
-        results["issues_rad_to_gh"] = await self.sync_issues_radicle_to_github()
+        # Take every listing before creating anything, so neither direction
+        # sees (and syncs back) items the other creates during this pass
+        found = await asyncio.gather(*(listings[name][0]() for name in selected))
         
-        # Sync patches both directions  
-        results["patches_gh_to_rad"] = await self.sync_patches_github_to_radicle()
-        results["patches_rad_to_gh"] = await self.sync_patches_radicle_to_github()
+        # Run the selected passes at once
+        outcomes = await asyncio.gather(*(
+            listings[name][1](items) for name, items in zip(selected, found)
+        ))
+        results = dict(zip(selected, outcomes))
         
-        # Update last sync time
-        self.db.data["last_sync"] = datetime.now().isoformat()
-        self.db.save_db()
+        # Stamp the sync time only when something was synced, and write every
+        # change from this pass at once; a run with nothing to do writes nothing
+        if any(result["created"] or result["updated"] for result in results.values()):
+            self.db.set("last_sync", datetime.now().isoformat())
+        await self.db.flush()
         
         return results
 
@@ -596,6 +1255,8 @@ async def main():
     except Exception as e:
         print(f"❌ Sync failed: {e}")
         return 1
+    finally:
+        await syncer.close()
 
 
 if __name__ == "__main__":
@@ -4,61 +4,93 @@ Summary of the Radicle + GitHub MCP setup.
 """
 
 import json
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional: pip install radicle-mcp[fast]
+    orjson = None
+
+VSCODE_CONFIG = '.vscode/mcp.json'
+
+
+@lru_cache(maxsize=4)
+def _load_json(path: str, mtime: float):
+    """Parse a JSON file; keyed on mtime so edits are picked up."""
+    raw = Path(path).read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+@lru_cache(maxsize=4)
+def _pretty_json(path: str, mtime: float) -> str:
+    """Pretty-print a JSON file with two-space indents."""
+    config = _load_json(path, mtime)
+    if orjson:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(config, indent=2)
+
+
+def config_text(path: str = VSCODE_CONFIG) -> str:
+    """A JSON config file pretty-printed for display, reused until the file changes."""
+    return _pretty_json(path, os.stat(path).st_mtime)
+
+SUMMARY = """🌟 RADICLE + GITHUB MCP SETUP SUMMARY
+{sep}
+
+📦 INSTALLED SERVERS:
+1. ✅ Radicle MCP Server (Python)
+   - Location: src/radicle_mcp/server.py
+   - Command: python -m radicle_mcp.server
+   - Tools: rad_init, rad_clone, rad_sync, rad_push, rad_patch_list, etc.
+
+2. ✅ GitHub MCP Server (Official)
+   - Location: /home/vscode/.deno/bin/github-mcp
+   - Command: github-mcp
+   - Tools: GitHub repo management, issues, PRs, file operations
+
+🔧 CONFIGURATION FILES:
+- .vscode/mcp.json (VS Code MCP config)
+- ~/.config/claude/claude_desktop_config.json (Claude Desktop)
+{config_section}
+🚀 GETTING STARTED:
+1. Set GitHub token: export GITHUB_PERSONAL_ACCESS_TOKEN=your_token
+2. Open Claude Desktop (it will automatically load both servers)
+3. Look for the MCP tools icon in Claude
+4. Try commands like:
+   - 'Show me my Radicle repositories'
+   - 'Create a new GitHub repository'
+   - 'List issues in my project'
+
+🔗 PUBLISHING TO GITHUB:
+You can now use the GitHub MCP to:
+- Create a new GitHub repository
+- Push your Radicle project to GitHub
+- Manage issues and pull requests
+- Sync between both platforms
+
+💡 EXAMPLE WORKFLOW:
+1. 'Create a GitHub repository named radicle-mcp'
+2. 'Add GitHub as a remote to this repository'
+3. 'Push the current code to GitHub'
+4. 'Create a README issue on GitHub'
+
+🎉 Both Radicle and GitHub are now available through MCP!
+"""
+
+
 def show_setup_summary():
     """Display a summary of the current MCP setup."""
     
-    print("🌟 RADICLE + GITHUB MCP SETUP SUMMARY")
-    print("=" * 60)
-    
-    print("\n📦 INSTALLED SERVERS:")
-    print("1. ✅ Radicle MCP Server (Python)")
-    print("   - Location: src/radicle_mcp/server.py")
-    print("   - Command: python -m radicle_mcp.server")
-    print("   - Tools: rad_init, rad_clone, rad_sync, rad_push, rad_patch_list, etc.")
-    
-    print("\n2. ✅ GitHub MCP Server (Official)")
-    print("   - Location: /home/vscode/.deno/bin/github-mcp")
-    print("   - Command: github-mcp")
-    print("   - Tools: GitHub repo management, issues, PRs, file operations")
-    
-    print("\n🔧 CONFIGURATION FILES:")
-    print("- .vscode/mcp.json (VS Code MCP config)")
-    print("- ~/.config/claude/claude_desktop_config.json (Claude Desktop)")
-    
     # Show VS Code MCP config
     try:
-        with open('.vscode/mcp.json', 'r') as f:
-            config = json.load(f)
-        print("\n📋 VS Code MCP Configuration:")
-        print(json.dumps(config, indent=2))
+        config_section = f"\n📋 VS Code MCP Configuration:\n{config_text()}\n"
     except FileNotFoundError:
-        print("\n❌ VS Code MCP config not found")
-    
-    print("\n🚀 GETTING STARTED:")
-    print("1. Set GitHub token: export GITHUB_PERSONAL_ACCESS_TOKEN=your_token")
-    print("2. Open Claude Desktop (it will automatically load both servers)")
-    print("3. Look for the MCP tools icon in Claude")
-    print("4. Try commands like:")
-    print("   - 'Show me my Radicle repositories'")
-    print("   - 'Create a new GitHub repository'")
-    print("   - 'List issues in my project'")
-    
-    print("\n🔗 PUBLISHING TO GITHUB:")
-    print("You can now use the GitHub MCP to:")
-    print("- Create a new GitHub repository")
-    print("- Push your Radicle project to GitHub")
-    print("- Manage issues and pull requests")
-    print("- Sync between both platforms")
-    
-    print("\n💡 EXAMPLE WORKFLOW:")
-    print("1. 'Create a GitHub repository named radicle-mcp'")
-    print("2. 'Add GitHub as a remote to this repository'")
-    print("3. 'Push the current code to GitHub'")
-    print("4. 'Create a README issue on GitHub'")
+        config_section = "\n❌ VS Code MCP config not found\n"
     
-    print("\n🎉 Both Radicle and GitHub are now available through MCP!")
+    sys.stdout.write(SUMMARY.format(sep="=" * 60, config_section=config_section))
 
 if __name__ == "__main__":
     show_setup_summary()
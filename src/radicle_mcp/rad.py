@@ -0,0 +1,22 @@
+"""Locating the rad executable, shared by the server and the GitHub sync module."""
+
+import shutil
+from typing import Optional
+
+# Absolute path of the rad executable, once found
+_RAD_BIN: Optional[str] = None
+
+
+def rad_binary() -> str:
+    """
+    Absolute path of rad, so each spawn skips the PATH search.
+    
+    Resolved on first success and then reused; raises FileNotFoundError
+    while rad is not on PATH.
+    """
+    global _RAD_BIN
+    if _RAD_BIN is None:
+        _RAD_BIN = shutil.which("rad")
+        if _RAD_BIN is None:
+            raise FileNotFoundError("rad command not found")
+    return _RAD_BIN
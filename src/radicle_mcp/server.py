@@ -7,40 +7,320 @@ a peer-to-peer code collaboration network.
 """
 
 import asyncio
+import contextlib
+import hashlib
+import importlib.util
+import io
 import subprocess
 import json
 import logging
 import sys
 import os
-from typing import Any, Dict, List, Optional
+import shlex
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 from pathlib import Path
 
+import anyio
 from mcp.server.fastmcp import FastMCP
 
-# Import our sync functionality
+from radicle_mcp.rad import rad_binary
+
 try:
-    import sys
-    sys.path.append(str(Path(__file__).parent.parent.parent))
+    import uvloop
+except ImportError:  # optional: pip install radicle-mcp[fast]
+    uvloop = None
+
+# The repository root, which holds github_radicle_sync.py
+REPO_ROOT = str(Path(__file__).resolve().parents[2])
+if REPO_ROOT not in sys.path:
+    sys.path.append(REPO_ROOT)
+
+# Our sync functionality pulls in aiohttp, so it is only imported when a
+# sync tool first runs; at startup we just check that it can be found
+SYNC_AVAILABLE = all(importlib.util.find_spec(name) is not None for name in ("github_radicle_sync", "aiohttp"))
+if TYPE_CHECKING:
     from github_radicle_sync import GitHubRadicleSyncer
-    SYNC_AVAILABLE = True
-except ImportError:
-    SYNC_AVAILABLE = False
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("radicle-mcp")
 
+@contextlib.asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the cached sync clients (saving their databases) when the server stops."""
+    try:
+        yield
+    finally:
+        syncers = [syncer for syncer, _ in _SYNCERS.values()]
+        _SYNCERS.clear()
+        await asyncio.gather(*(syncer.close() for syncer in syncers), return_exceptions=True)
+
+
 # Initialize the MCP server
-mcp = FastMCP("Radicle MCP Server")
+mcp = FastMCP("Radicle MCP Server", lifespan=lifespan)
+
+# How long successful results of read-only rad queries are reused; the node
+# identity and help text only change when rad itself does
+CACHE_TTL = 5.0
+CACHE_TTL_STABLE = 3600.0
+CACHE_MAX_ENTRIES = 128
+
+# rad subcommands that change state and are never served from the cache;
+# running one drops every cached result
+MUTATING_COMMANDS = frozenset({"init", "clone", "sync", "push"})
+
+# Seconds a rad command may run before it is killed; network-bound
+# commands (clone, sync, push) get the longer limit
+RAD_COMMAND_TIMEOUT = 30.0
+RAD_NETWORK_TIMEOUT = 300.0
+
+# Help text survives restarts here, one file per rad binary and subcommand
+HELP_CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "radicle-mcp"
+
+# Longest single output line stream_process accepts
+STREAM_LINE_LIMIT = 2 ** 20
+
+# Child processes allowed to run at once; further commands wait for a slot
+MAX_CONCURRENT_PROCESSES = int(os.getenv("RAD_MCP_CONCURRENCY", "8"))
+
+# argv prefixes for the rad tools, built once; per-call arguments are
+# concatenated onto them
+RAD_INIT = ("rad", "init", "--name")
+RAD_CLONE = ("rad", "clone")
+RAD_SYNC = ("rad", "sync")
+RAD_PUSH = ("rad", "push")
+RAD_PATCH_LIST = ("rad", "patch", "list")
+RAD_ISSUE_LIST = ("rad", "issue", "list")
+RAD_SELF = ("rad", "self")
+RAD_INSPECT = ("rad", "inspect")
+RAD_REMOTE = ("rad", "remote")
+RAD_HELP = ("rad", "--help")
+
+# Sections of rad_overview: (heading, command)
+OVERVIEW_SECTIONS = [
+    ("🆔 Radicle ID", RAD_SELF),
+    ("📊 Repository status", RAD_INSPECT),
+    ("🌐 Remotes", RAD_REMOTE),
+    ("📋 Patches", RAD_PATCH_LIST),
+    ("🐛 Issues", RAD_ISSUE_LIST),
+]
+
+# (token digest, repo) -> (syncer, lock serialising its use), kept across
+# calls so the mapping database and GitHub HTTP session are only set up
+# once; closed on shutdown
+_SYNCERS: Dict[Tuple[str, str], Tuple["GitHubRadicleSyncer", asyncio.Lock]] = {}
+
+# (command, cwd) -> (expiry, result) for read-only rad queries, least recently used first
+_CACHE: "OrderedDict[Tuple[Tuple[str, ...], Optional[str]], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+# One process-slot semaphore per event loop, as a semaphore can't be shared across loops
+_PROCESS_SLOTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def process_slots() -> asyncio.Semaphore:
+    """Semaphore bounding the running loop's child processes to MAX_CONCURRENT_PROCESSES."""
+    loop = asyncio.get_running_loop()
+    slots = _PROCESS_SLOTS.get(loop)
+    if slots is None:
+        slots = _PROCESS_SLOTS[loop] = asyncio.Semaphore(MAX_CONCURRENT_PROCESSES)
+    return slots
+
+
+async def spawn_process(command: Sequence[str], cwd: Optional[str] = None,
+                        capture_stderr: bool = True) -> subprocess.Popen:
+    """
+    Start a subprocess with piped output from a worker thread.
+    
+    asyncio.create_subprocess_exec forks on the event loop thread, stalling
+    every other task for the duration of the spawn; doing it in a thread
+    keeps concurrent tool calls moving. With ``capture_stderr=False`` stderr
+    shares the stdout pipe instead of getting its own. If the caller is
+    cancelled mid-spawn, the process is killed as soon as it exists.
+    """
+    spawn = asyncio.ensure_future(asyncio.to_thread(
+        subprocess.Popen,
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE if capture_stderr else subprocess.STDOUT,
+        cwd=cwd
+    ))
+    try:
+        return await asyncio.shield(spawn)
+    except asyncio.CancelledError:
+        spawn.add_done_callback(kill_spawned)
+        raise
+
+
+def kill_spawned(spawn: "asyncio.Future[subprocess.Popen]") -> None:
+    """Kill a process whose spawn completed after its caller was cancelled."""
+    if not spawn.cancelled() and spawn.exception() is None:
+        spawn.result().kill()
+
+
+def decode_output(data: bytes) -> str:
+    """Decode captured output, stripping only when it has surrounding whitespace."""
+    if not data:
+        return ""
+    text = data.decode("utf-8", "replace")
+    if text[0].isspace() or text[-1].isspace():
+        text = text.strip()
+    return text
+
+
+async def run_process(command: Sequence[str], cwd: Optional[str] = None,
+                      timeout: float = RAD_COMMAND_TIMEOUT, capture_stderr: bool = True) -> Dict[str, Any]:
+    """
+    Run a command, killing it after ``timeout`` seconds or when cancelled.
+    
+    With ``capture_stderr=False`` both streams are read through one pipe;
+    the combined output is returned as stdout, and also as stderr on failure.
+    Waits for a free slot first (see MAX_CONCURRENT_PROCESSES).
+    
+    Returns:
+        Dictionary with stdout, stderr, and return_code; spawn errors propagate
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Running command: %s", shlex.join(command))
+    
+    async with process_slots():
+        process = await spawn_process(command, cwd=cwd, capture_stderr=capture_stderr)
+        try:
+            stdout, stderr = await asyncio.wait_for(asyncio.to_thread(process.communicate), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await asyncio.to_thread(process.wait)
+            return {
+                "stdout": "",
+                "stderr": f"Command timed out after {timeout:g}s",
+                "return_code": 124,
+                "success": False
+            }
+        except asyncio.CancelledError:
+            # Don't leave the child (or the thread blocked on it) behind
+            process.kill()
+            raise
+        
+        output = decode_output(stdout)
+        success = process.returncode == 0
+        if capture_stderr:
+            errors = decode_output(stderr)
+        else:
+            errors = "" if success else output
+        return {
+            "stdout": output,
+            "stderr": errors,
+            "return_code": process.returncode,
+            "success": success
+        }
+
+
+async def stream_process(command: Sequence[str], cwd: Optional[str] = None,
+                         timeout: float = RAD_COMMAND_TIMEOUT, capture_stderr: bool = True) -> AsyncIterator[str]:
+    """
+    Run a command, yielding its stdout line by line as it arrives.
+    
+    The process is killed if the caller stops iterating early or ``timeout``
+    seconds pass (asyncio.TimeoutError). A non-zero exit raises
+    subprocess.CalledProcessError carrying the decoded stderr; with
+    ``capture_stderr=False`` stderr lines are yielded along with stdout.
+    The process holds one of the MAX_CONCURRENT_PROCESSES slots until the
+    generator finishes, so don't start other commands while iterating.
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Streaming command: %s", shlex.join(command))
+    
+    async with process_slots():
+        process = await spawn_process(command, cwd=cwd, capture_stderr=capture_stderr)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        reader = asyncio.StreamReader(limit=STREAM_LINE_LIMIT)
+        transport, _ = await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), process.stdout)
+        # Drain stderr alongside so a chatty command can't block on a full pipe
+        stderr = asyncio.ensure_future(asyncio.to_thread(process.stderr.read)) if capture_stderr else None
+        try:
+            while True:
+                line = await asyncio.wait_for(reader.readline(), deadline - loop.time())
+                if not line:
+                    break
+                yield line.decode("utf-8", "replace").rstrip("\r\n")
+            
+            return_code = await asyncio.wait_for(asyncio.to_thread(process.wait), deadline - loop.time())
+            if return_code:
+                errors = decode_output(await stderr) if stderr is not None else ""
+                raise subprocess.CalledProcessError(return_code, command, stderr=errors)
+        finally:
+            transport.close()
+            if process.poll() is None:
+                process.kill()
+                await asyncio.to_thread(process.wait)
+            if stderr is not None:
+                await asyncio.gather(stderr, return_exceptions=True)
+
+
+async def collect_rad_command(command: Sequence[str], cwd: Optional[str] = None,
+                              timeout: float = RAD_COMMAND_TIMEOUT) -> Dict[str, Any]:
+    """
+    Run a rad command through stream_process, accumulating its output.
+    
+    Returns:
+        The same dictionary as run_rad_command; stderr is only kept on failure
+    """
+    output = io.StringIO()
+    try:
+        async for line in stream_process((rad_binary(), *command[1:]), cwd=cwd, timeout=timeout):
+            output.write(line)
+            output.write("\n")
+    except subprocess.CalledProcessError as e:
+        return {
+            "stdout": output.getvalue().strip(),
+            "stderr": e.stderr,
+            "return_code": e.returncode,
+            "success": False
+        }
+    except asyncio.TimeoutError:
+        return {
+            "stdout": "",
+            "stderr": f"Command timed out after {timeout:g}s",
+            "return_code": 124,
+            "success": False
+        }
+    except FileNotFoundError:
+        return {
+            "stdout": "",
+            "stderr": "rad command not found. Please ensure Radicle is installed.",
+            "return_code": 127,
+            "success": False
+        }
+    except Exception as e:
+        return {
+            "stdout": "",
+            "stderr": f"Error running command: {str(e)}",
+            "return_code": 1,
+            "success": False
+        }
+    
+    return {
+        "stdout": output.getvalue().strip(),
+        "stderr": "",
+        "return_code": 0,
+        "success": True
+    }
 
 
-async def run_rad_command(command: List[str], cwd: Optional[str] = None) -> Dict[str, Any]:
+async def run_rad_command(command: Sequence[str], cwd: Optional[str] = None,
+                          timeout: float = RAD_COMMAND_TIMEOUT, capture_stderr: bool = True) -> Dict[str, Any]:
     """
     Run a rad command and return the result.
     
     Args:
         command: List of command arguments starting with 'rad'
         cwd: Working directory to run the command in
+        timeout: Seconds to wait before killing the command
+        capture_stderr: Pipe stderr separately; False folds it into stdout
         
     Returns:
         Dictionary with stdout, stderr, and return_code
@@ -48,25 +328,12 @@ async def run_rad_command(command: List[str], cwd: Optional[str] = None) -> Dict
     try:
         # Ensure command starts with 'rad'
         if not command or command[0] != "rad":
-            command = ["rad"] + command
-            
-        logger.info(f"Running command: {' '.join(command)}")
+            command = ("rad", *command)
         
-        process = await asyncio.create_subprocess_exec(
-            *command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=cwd
-        )
-        
-        stdout, stderr = await process.communicate()
-        
-        return {
-            "stdout": stdout.decode("utf-8").strip(),
-            "stderr": stderr.decode("utf-8").strip(),
-            "return_code": process.returncode,
-            "success": process.returncode == 0
-        }
+        if command[1:2] and command[1] in MUTATING_COMMANDS:
+            _CACHE.clear()
+        return await run_process((rad_binary(), *command[1:]), cwd=cwd, timeout=timeout,
+                                 capture_stderr=capture_stderr)
         
     except FileNotFoundError:
         return {
@@ -84,6 +351,115 @@ async def run_rad_command(command: List[str], cwd: Optional[str] = None) -> Dict
         }
 
 
+def cache_ttl(command: Sequence[str]) -> float:
+    """Seconds a successful result of ``command`` may be reused."""
+    if tuple(command) == RAD_SELF or "--help" in command:
+        return CACHE_TTL_STABLE
+    return CACHE_TTL
+
+
+async def run_cached_rad_command(command: Sequence[str], cwd: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run a read-only rad command, reusing a recent successful result.
+    
+    Output is streamed in line by line rather than buffered by communicate().
+    
+    Args:
+        command: List of command arguments starting with 'rad'
+        cwd: Working directory to run the command in
+        
+    Returns:
+        Dictionary with stdout, stderr, and return_code
+    """
+    if command[1:2] and command[1] in MUTATING_COMMANDS:
+        return await run_rad_command(command, cwd=cwd)
+    
+    key = (tuple(command), cwd)
+    cached = _CACHE.get(key)
+    if cached is not None and time.monotonic() < cached[0]:
+        _CACHE.move_to_end(key)
+        return cached[1]
+    
+    result = await collect_rad_command(command, cwd=cwd)
+    if result["success"]:
+        _CACHE[key] = (time.monotonic() + cache_ttl(command), result)
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > CACHE_MAX_ENTRIES:
+            _CACHE.popitem(last=False)
+    return result
+
+
+def help_cache_path(command: Optional[str]) -> Optional[Path]:
+    """
+    File caching the help text of ``rad [command] --help``.
+    
+    The name is keyed on the rad binary's path and mtime, so upgrading rad
+    invalidates it. Returns None when rad is not on PATH.
+    """
+    try:
+        rad = rad_binary()
+    except FileNotFoundError:
+        return None
+    key = f"{rad}\0{os.stat(rad).st_mtime_ns}\0{command or ''}"
+    return HELP_CACHE_DIR / f"help-{hashlib.blake2s(key.encode()).hexdigest()}.txt"
+
+
+def write_help_cache(path: Path, text: str):
+    """Store help text, replacing the file atomically; failures only cost a respawn later."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning("Could not cache rad help text: %s", e)
+
+
+async def run_commands_in_shell(commands: Sequence[Sequence[str]], cwd: Optional[str] = None,
+                                timeout: float = RAD_COMMAND_TIMEOUT) -> List[Dict[str, Any]]:
+    """
+    Run commands one after another in a single ``sh -c``, paying for one process start.
+    
+    Each command's stderr is folded into its stdout. If the shell is killed
+    (after ``timeout`` seconds per command) or never reports back, the
+    commands without a result get its error instead.
+    
+    Returns:
+        One result dictionary per command, in order, as from run_process;
+        spawn errors propagate
+    """
+    separator = f"__radicle_mcp_{uuid.uuid4().hex}__"
+    script = "\n".join(f"{shlex.join(command)} 2>&1; echo \"{separator} $?\"" for command in commands)
+    result = await run_process(["sh", "-c", script], cwd=cwd, timeout=timeout * len(commands))
+    
+    results = []
+    lines: List[str] = []
+    for line in result["stdout"].splitlines():
+        output, found, return_code = line.partition(separator)
+        if output:
+            lines.append(output)
+        if found:
+            # The marker follows output that had no trailing newline on the same line
+            stdout = "\n".join(lines).strip()
+            code = int(return_code)
+            results.append({
+                "stdout": stdout,
+                "stderr": "" if code == 0 else stdout,
+                "return_code": code,
+                "success": code == 0
+            })
+            lines = []
+    
+    for _ in commands[len(results):]:
+        results.append({
+            "stdout": "",
+            "stderr": result["stderr"] or "Command did not run",
+            "return_code": result["return_code"] or 1,
+            "success": False
+        })
+    return results
+
+
 @mcp.tool()
 async def rad_init(name: str, description: str = "", public: bool = True) -> str:
     """
@@ -94,16 +470,11 @@ async def rad_init(name: str, description: str = "", public: bool = True) -> str
         description: Description of the repository
         public: Whether the repository should be public (default: True)
     """
-    command = ["rad", "init", "--name", name]
-    
-    if description:
-        command.extend(["--description", description])
-    
-    if public:
-        command.append("--public")
-    else:
-        command.append("--private")
-    
+    command = (
+        RAD_INIT + (name,)
+        + (("--description", description) if description else ())
+        + (("--public",) if public else ("--private",))
+    )
     result = await run_rad_command(command)
     
     if result["success"]:
@@ -121,12 +492,8 @@ async def rad_clone(rid: str, path: Optional[str] = None) -> str:
         rid: Repository ID (RID) to clone
         path: Optional path where to clone the repository
     """
-    command = ["rad", "clone", rid]
-    
-    if path:
-        command.append(path)
-    
-    result = await run_rad_command(command)
+    command = RAD_CLONE + ((rid, path) if path else (rid,))
+    result = await run_rad_command(command, timeout=RAD_NETWORK_TIMEOUT)
     
     if result["success"]:
         return f"✅ Successfully cloned repository {rid}\n{result['stdout']}"
@@ -142,7 +509,8 @@ async def rad_sync(repository_path: str = ".") -> str:
     Args:
         repository_path: Path to the repository (default: current directory)
     """
-    result = await run_rad_command(["rad", "sync"], cwd=repository_path)
+    result = await run_rad_command(RAD_SYNC, cwd=repository_path, timeout=RAD_NETWORK_TIMEOUT,
+                                   capture_stderr=False)
     
     if result["success"]:
         return f"✅ Successfully synced repository\n{result['stdout']}"
@@ -158,7 +526,8 @@ async def rad_push(repository_path: str = ".") -> str:
     Args:
         repository_path: Path to the repository (default: current directory)
     """
-    result = await run_rad_command(["rad", "push"], cwd=repository_path)
+    result = await run_rad_command(RAD_PUSH, cwd=repository_path, timeout=RAD_NETWORK_TIMEOUT,
+                                   capture_stderr=False)
     
     if result["success"]:
         return f"✅ Successfully pushed changes\n{result['stdout']}"
@@ -174,7 +543,7 @@ async def rad_patch_list(repository_path: str = ".") -> str:
     Args:
         repository_path: Path to the repository (default: current directory)
     """
-    result = await run_rad_command(["rad", "patch", "list"], cwd=repository_path)
+    result = await run_cached_rad_command(RAD_PATCH_LIST, cwd=repository_path)
     
     if result["success"]:
         if result["stdout"]:
@@ -193,7 +562,7 @@ async def rad_issue_list(repository_path: str = ".") -> str:
     Args:
         repository_path: Path to the repository (default: current directory)
     """
-    result = await run_rad_command(["rad", "issue", "list"], cwd=repository_path)
+    result = await run_cached_rad_command(RAD_ISSUE_LIST, cwd=repository_path)
     
     if result["success"]:
         if result["stdout"]:
@@ -209,7 +578,7 @@ async def rad_id() -> str:
     """
     Get the current node's Radicle ID.
     """
-    result = await run_rad_command(["rad", "self"])
+    result = await run_cached_rad_command(RAD_SELF)
     
     if result["success"]:
         return f"🆔 Your Radicle ID:\n{result['stdout']}"
@@ -225,7 +594,7 @@ async def rad_status(repository_path: str = ".") -> str:
     Args:
         repository_path: Path to the repository (default: current directory)
     """
-    result = await run_rad_command(["rad", "inspect"], cwd=repository_path)
+    result = await run_cached_rad_command(RAD_INSPECT, cwd=repository_path)
     
     if result["success"]:
         return f"📊 Repository status:\n{result['stdout']}"
@@ -241,7 +610,7 @@ async def rad_remote_list(repository_path: str = ".") -> str:
     Args:
         repository_path: Path to the repository (default: current directory)
     """
-    result = await run_rad_command(["rad", "remote"], cwd=repository_path)
+    result = await run_cached_rad_command(RAD_REMOTE, cwd=repository_path)
     
     if result["success"]:
         if result["stdout"]:
@@ -260,19 +629,113 @@ async def rad_help(command: Optional[str] = None) -> str:
     Args:
         command: Specific command to get help for (optional)
     """
+    cache_path = help_cache_path(command)
+    if cache_path is not None and cache_path.is_file():
+        return f"📖 Radicle Help:\n{cache_path.read_text(encoding='utf-8')}"
+    
     if command:
-        result = await run_rad_command(["rad", command, "--help"])
+        result = await run_cached_rad_command(("rad", command, "--help"))
     else:
-        result = await run_rad_command(["rad", "--help"])
+        result = await run_cached_rad_command(RAD_HELP)
     
     if result["success"]:
+        if cache_path is not None and result["stdout"]:
+            write_help_cache(cache_path, result["stdout"])
         return f"📖 Radicle Help:\n{result['stdout']}"
     else:
         return f"❌ Failed to get help: {result['stderr']}"
 
 
+@mcp.tool()
+async def rad_overview(repository_path: str = ".") -> str:
+    """
+    Get identity, status, remotes, patches and issues of a repository in one call.
+    
+    All five rad commands run in a single shell, so the call pays for one
+    process start instead of five.
+    
+    Args:
+        repository_path: Path to the repository (default: current directory)
+    """
+    try:
+        results = await run_commands_in_shell([command for _, command in OVERVIEW_SECTIONS],
+                                              cwd=repository_path)
+    except Exception as e:
+        return f"❌ Failed to get repository overview: {str(e)}"
+    
+    parts = []
+    for (heading, _), result in zip(OVERVIEW_SECTIONS, results):
+        if result["success"]:
+            parts.append(f"{heading}:\n{result['stdout'] or '(none)'}")
+        else:
+            parts.append(f"❌ {heading}: {result['stderr']}")
+    return "\n\n".join(parts)
+
+
+@mcp.tool()
+async def rad_batch(inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Run several rad commands concurrently in one call.
+    
+    Args:
+        inputs: One entry per command, e.g. {"cmd": ["inspect"], "cwd": ".", "timeout": 30};
+            cmd is the argument list after 'rad', cwd and timeout are optional
+    
+    Returns:
+        One result per input, in order, with stdout, stderr, return_code and success
+    """
+    async def run(item: Dict[str, Any]) -> Dict[str, Any]:
+        command = item.get("cmd")
+        if isinstance(command, str):
+            command = shlex.split(command)
+        if not command:
+            return {
+                "stdout": "",
+                "stderr": "Missing 'cmd' argument list",
+                "return_code": 2,
+                "success": False
+            }
+        return await run_rad_command(command, cwd=item.get("cwd"),
+                                     timeout=float(item.get("timeout", RAD_COMMAND_TIMEOUT)))
+    
+    return await asyncio.gather(*(run(item) for item in inputs))
+
+
+@mcp.tool()
+async def rad_cache_invalidate() -> str:
+    """
+    Forget cached results of read-only rad queries, e.g. after changing a repository outside this server.
+    """
+    count = len(_CACHE)
+    _CACHE.clear()
+    return f"🧹 Cleared {count} cached rad results"
+
+
 # GitHub Sync Tools (if available)
 if SYNC_AVAILABLE:
+    # Token from the server's environment, used when a call doesn't pass one
+    GITHUB_TOKEN = os.getenv("GITHUB_PERSONAL_ACCESS_TOKEN")
+    
+    @contextlib.asynccontextmanager
+    async def use_syncer(token: str, github_repo: str) -> AsyncIterator["GitHubRadicleSyncer"]:
+        """
+        Hold the shared syncer for a token and repository, creating it on first use.
+        
+        Calls are serialised per syncer, so two syncs can't both act on the
+        same unmapped items. On entry the syncer re-reads its mapping
+        database if another process (e.g. sync_cli.py) has written it since.
+        """
+        key = (hashlib.blake2b(token.encode(), digest_size=8).hexdigest(), github_repo)
+        entry = _SYNCERS.get(key)
+        if entry is None:
+            from github_radicle_sync import GitHubRadicleSyncer
+            entry = _SYNCERS[key] = (GitHubRadicleSyncer(token, github_repo), asyncio.Lock())
+        syncer, lock = entry
+        async with lock:
+            if syncer.db.reload_if_changed():
+                syncer.db.set("github_repo", github_repo)
+            yield syncer
+    
     @mcp.tool()
     async def github_sync_test(github_repo: str, github_token: Optional[str] = None) -> str:
         """
@@ -283,26 +746,26 @@ if SYNC_AVAILABLE:
             github_token: GitHub personal access token (or set GITHUB_PERSONAL_ACCESS_TOKEN env var)
         """
         try:
-            token = github_token or os.getenv("GITHUB_PERSONAL_ACCESS_TOKEN")
+            token = github_token or GITHUB_TOKEN
             if not token:
                 return "❌ GitHub token required. Set GITHUB_PERSONAL_ACCESS_TOKEN or provide github_token parameter"
             
-            syncer = GitHubRadicleSyncer(token, github_repo)
-            
-            # Test connectivity
-            github_issues = syncer.github.get_issues()
-            radicle_issues = await syncer.radicle.get_issues()
-            github_prs = syncer.github.get_pull_requests()
-            radicle_patches = await syncer.radicle.get_patches()
-            
-            result = f"✅ GitHub ↔ Radicle sync connectivity test successful!\n\n"
-            result += f"📊 Current state:\n"
-            result += f"  GitHub issues: {len(github_issues)}\n"
-            result += f"  Radicle issues: {len(radicle_issues)}\n"
-            result += f"  GitHub PRs: {len(github_prs)}\n"
-            result += f"  Radicle patches: {len(radicle_patches)}\n"
-            result += f"  Existing mappings: {len(syncer.db.data.get('issues', {}))} issues, {len(syncer.db.data.get('patches', {}))} patches\n"
-            result += f"  Last sync: {syncer.db.data.get('last_sync', 'Never')}"
+            # Test connectivity; the probes are independent, so run them together
+            async with use_syncer(token, github_repo) as syncer:
+                (github_issue_count, github_pr_count), radicle_issues, radicle_patches = await asyncio.gather(
+                    syncer.github.count_items(),
+                    syncer.radicle.get_issues(),
+                    syncer.radicle.get_patches()
+                )
+                
+                result = f"✅ GitHub ↔ Radicle sync connectivity test successful!\n\n"
+                result += f"📊 Current state:\n"
+                result += f"  GitHub issues: {github_issue_count}\n"
+                result += f"  Radicle issues: {len(radicle_issues)}\n"
+                result += f"  GitHub PRs: {github_pr_count}\n"
+                result += f"  Radicle patches: {len(radicle_patches)}\n"
+                result += f"  Existing mappings: {syncer.db.count('issues')} issues, {syncer.db.count('patches')} patches\n"
+                result += f"  Last sync: {syncer.db.data.get('last_sync', 'Never')}"
             
             return result
             
@@ -320,22 +783,19 @@ if SYNC_AVAILABLE:
             direction: Sync direction - 'both', 'github-to-radicle', or 'radicle-to-github'
         """
         try:
-            token = github_token or os.getenv("GITHUB_PERSONAL_ACCESS_TOKEN")
+            token = github_token or GITHUB_TOKEN
             if not token:
                 return "❌ GitHub token required. Set GITHUB_PERSONAL_ACCESS_TOKEN or provide github_token parameter"
             
-            syncer = GitHubRadicleSyncer(token, github_repo)
-            
-            results = {}
-            
+            passes = {}
             if direction in ["both", "github-to-radicle"]:
-                results["github_to_radicle"] = await syncer.sync_issues_github_to_radicle()
-            
+                passes["issues_gh_to_rad"] = "github_to_radicle"
             if direction in ["both", "radicle-to-github"]:
-                results["radicle_to_github"] = await syncer.sync_issues_radicle_to_github()
+                passes["issues_rad_to_gh"] = "radicle_to_github"
             
-            syncer.db.data["last_sync"] = syncer.db.data.get("last_sync", "")
-            syncer.db.save_db()
+            async with use_syncer(token, github_repo) as syncer:
+                synced = await syncer.sync_all(passes)
+            results = {label: synced[name] for name, label in passes.items()}
             
             result = f"✅ Issue synchronization complete!\n\n"
             result += f"📊 Results:\n"
@@ -357,12 +817,12 @@ if SYNC_AVAILABLE:
             github_token: GitHub personal access token (or set GITHUB_PERSONAL_ACCESS_TOKEN env var)
         """
         try:
-            token = github_token or os.getenv("GITHUB_PERSONAL_ACCESS_TOKEN")
+            token = github_token or GITHUB_TOKEN
             if not token:
                 return "❌ GitHub token required. Set GITHUB_PERSONAL_ACCESS_TOKEN or provide github_token parameter"
             
-            syncer = GitHubRadicleSyncer(token, github_repo)
-            results = await syncer.sync_all()
+            async with use_syncer(token, github_repo) as syncer:
+                results = await syncer.sync_all()
             
             result = f"✅ Full synchronization complete!\n\n"
             result += f"📊 Results:\n"
@@ -387,7 +847,11 @@ else:
 
 def main():
     """Main entry point for the MCP server."""
-    mcp.run()
+    if uvloop is None:
+        mcp.run()
+    else:
+        # What mcp.run() does for stdio, but on a uvloop event loop
+        anyio.run(mcp.run_stdio_async, backend_options={"use_uvloop": True})
 
 
 if __name__ == "__main__":
@@ -8,11 +8,12 @@ import argparse
 import asyncio
 import os
 import sys
-from github_radicle_sync import GitHubRadicleSyncer
+from typing import Iterable, List, Optional
+from github_radicle_sync import SYNC_PASSES, GitHubRadicleSyncer
 
 
-async def main():
-    """Main CLI function."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
     parser = argparse.ArgumentParser(
         description="Synchronize GitHub and Radicle repositories"
     )
@@ -40,8 +41,16 @@ async def main():
         action="store_true",
         help="Sync only patches/PRs, not issues"
     )
-    
-    args = parser.parse_args()
+    return parser
+
+
+# Built once at import and reused by every main() call
+_PARSER = _build_parser()
+
+
+async def main(argv: Optional[List[str]] = None) -> int:
+    """Main CLI function; ``argv`` defaults to the process arguments."""
+    args = _PARSER.parse_args(argv)
     
     # Get token from args or environment
     github_token = args.token or os.getenv("GITHUB_PERSONAL_ACCESS_TOKEN")
@@ -49,42 +58,35 @@ async def main():
         print("❌ GitHub token required. Set GITHUB_PERSONAL_ACCESS_TOKEN or use --token")
         return 1
     
+    syncer = None
     try:
         syncer = GitHubRadicleSyncer(github_token, args.repo)
         
         if args.dry_run:
             print("🧪 DRY RUN MODE - No changes will be made")
             # Test connectivity and show current state
-            github_issues = syncer.github.get_issues()
-            radicle_issues = await syncer.radicle.get_issues()
-            github_prs = syncer.github.get_pull_requests()
-            radicle_patches = await syncer.radicle.get_patches()
+            (github_issue_count, github_pr_count), radicle_issues, radicle_patches = await asyncio.gather(
+                syncer.github.count_items(),
+                syncer.radicle.get_issues(),
+                syncer.radicle.get_patches()
+            )
             
             print(f"\n📊 Current state:")
-            print(f"  GitHub issues: {len(github_issues)}")
+            print(f"  GitHub issues: {github_issue_count}")
             print(f"  Radicle issues: {len(radicle_issues)}")
-            print(f"  GitHub PRs: {len(github_prs)}")
+            print(f"  GitHub PRs: {github_pr_count}")
             print(f"  Radicle patches: {len(radicle_patches)}")
-            print(f"  Existing mappings: {len(syncer.db.data.get('issues', {}))} issues, {len(syncer.db.data.get('patches', {}))} patches")
+            print(f"  Existing mappings: {syncer.db.count('issues')} issues, {syncer.db.count('patches')} patches")
             
         else:
             print(f"🚀 Starting sync for {args.repo}")
             
-            results = {}
-            
-            if not args.patches_only:
-                print("\n🔄 Syncing issues...")
-                results["issues_gh_to_rad"] = await syncer.sync_issues_github_to_radicle()
-                results["issues_rad_to_gh"] = await syncer.sync_issues_radicle_to_github()
-            
-            if not args.issues_only:
-                print("\n🔄 Syncing patches/PRs...")
-                results["patches_gh_to_rad"] = await syncer.sync_patches_github_to_radicle()
-                results["patches_rad_to_gh"] = await syncer.sync_patches_radicle_to_github()
-            
-            # Update last sync time
-            syncer.db.data["last_sync"] = syncer.db.data.get("last_sync", "")
-            syncer.db.save_db()
+            passes = [
+                name for name in SYNC_PASSES
+                if not (args.patches_only and name.startswith("issues_"))
+                and not (args.issues_only and name.startswith("patches_"))
+            ]
+            results = await syncer.sync_all(passes)
             
             print("\n📊 Sync Results:")
             for key, value in results.items():
@@ -99,6 +101,25 @@ async def main():
         import traceback
         traceback.print_exc()
         return 1
+    finally:
+        if syncer is not None:
+            await syncer.close()
+
+
+async def main_multiple(argv_list: Iterable[List[str]]) -> List[int]:
+    """
+    Run several sync jobs in one process, one after another.
+    
+    Returns each job's exit status; a job with bad arguments gets
+    argparse's status instead of ending the batch.
+    """
+    statuses = []
+    for argv in argv_list:
+        try:
+            statuses.append(await main(argv))
+        except SystemExit as e:
+            statuses.append(e.code)
+    return statuses
 
 
 if __name__ == "__main__":
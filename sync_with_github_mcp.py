@@ -4,102 +4,207 @@ Use MCP tools to sync with GitHub repository.
 """
 
 import asyncio
+import glob
+import os
+import subprocess
 import sys
 from pathlib import Path
 
-# Add the src directory to the path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+import _bootstrap  # noqa: F401  (puts src/ on sys.path if needed)
+
+try:
+    import pygit2
+except ImportError:  # optional: pip install radicle-mcp[fast]
+    pygit2 = None
+
+from radicle_mcp.server import (
+    RAD_COMMAND_TIMEOUT, RAD_INSPECT, RAD_NETWORK_TIMEOUT, RAD_REMOTE,
+    run_commands_in_shell, run_process, stream_process
+)
+
+# New files this script publishes; naming them keeps `git add` from
+# walking (and hashing) the rest of the worktree. Ones missing from a
+# checkout are skipped (see existing_paths)
+PUBLISHED_PATHS = ["src", ".vscode", ":(glob)*.py", "pyproject.toml", "README.md", "SYNC_README.md"]
+
+COMMIT_MESSAGE = (
+    "Add Radicle + GitHub MCP server integration\n\n- Complete Python MCP server for Radicle CLI\n"
+    "- GitHub MCP server integration\n- VS Code and Claude Desktop configuration\n- Setup and test scripts"
+)
+
+
+# Hooks git commit would run; libgit2 runs none of them
+COMMIT_HOOKS = ("pre-commit", "prepare-commit-msg", "commit-msg", "post-commit")
+
+
+class InProcessCommitUnavailable(Exception):
+    """The commit needs git commit itself: an operation to conclude, hooks to run, or signing."""
+
+
+def commit_in_process(message):
+    """
+    Commit the staged index with libgit2 instead of spawning git.
+    
+    libgit2 neither runs commit hooks nor signs, so repositories that use
+    either, or that are mid-merge (or similar), raise
+    InProcessCommitUnavailable for the caller to use git commit instead.
+    
+    Returns the new commit id, or None when there is nothing to commit.
+    """
+    repo = pygit2.Repository(pygit2.discover_repository("."))
+    if repo.state() != pygit2.enums.RepositoryState.NONE or repo.index.conflicts:
+        raise InProcessCommitUnavailable("repository has an operation in progress")
+    if "commit.gpgsign" in repo.config and repo.config.get_bool("commit.gpgsign"):
+        raise InProcessCommitUnavailable("commits are signed")
+    # A relative core.hooksPath is relative to the top of the work tree
+    hooks_path = repo.config["core.hooksPath"] if "core.hooksPath" in repo.config else None
+    hooks_dir = Path(repo.workdir or repo.path, os.path.expanduser(hooks_path)) if hooks_path else Path(repo.path, "hooks")
+    if any(os.access(hooks_dir / hook, os.X_OK) for hook in COMMIT_HOOKS):
+        raise InProcessCommitUnavailable("commit hooks are installed")
+    tree = repo.index.write_tree()
+    parents = [] if repo.head_is_unborn else [repo.head.target]
+    if parents and repo[parents[0]].tree_id == tree:
+        return None
+    signature = repo.default_signature
+    return repo.create_commit("HEAD", signature, signature, message, tree, parents)
+
+
+def existing_paths(pathspecs):
+    """The pathspecs that match something here, as git add fails outright on one that doesn't."""
+    return [spec for spec in pathspecs if glob.glob(spec.removeprefix(":(glob)"))]
+
+
+def emit(*lines):
+    """Print a stage's lines with one write rather than one per print()."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+async def run_streaming(command, timeout=RAD_COMMAND_TIMEOUT):
+    """Run a command, printing its output (stderr included) as it arrives; True on success."""
+    try:
+        async for line in stream_process(command, timeout=timeout, capture_stderr=False):
+            print(f"   {line}")
+    except subprocess.CalledProcessError:
+        return False
+    except asyncio.TimeoutError:
+        print(f"   Command timed out after {timeout:g}s")
+        return False
+    except OSError as e:
+        print(f"   {e}")
+        return False
+    return True
 
-from radicle_mcp.server import run_rad_command
 
 async def use_mcp_for_github_sync():
     """Use MCP tools to handle GitHub sync."""
     
-    print("🔄 Using MCP to sync with GitHub repository fovi-llc/radicle-mcp")
+    emit("🔄 Using MCP to sync with GitHub repository fovi-llc/radicle-mcp")
     
-    # First, let's check our current Radicle status
-    print("\n1. 📊 Checking current Radicle status...")
-    status_result = await run_rad_command(["rad", "inspect"])
-    print(f"Current RID: {status_result['stdout']}")
+    # Quick stages are reported in one write once they finish; stages that
+    # stream output announce themselves first so the output has a heading
     
-    # Check current remotes
-    print("\n2. 🌐 Checking current remotes...")
-    remote_result = await run_rad_command(["rad", "remote"])
-    print(f"Current remotes:\n{remote_result['stdout']}")
+    # Check our current Radicle status and remotes, both from one shell
+    status_result, remote_result = await run_commands_in_shell([RAD_INSPECT, RAD_REMOTE])
+    emit(
+        "\n1. 📊 Checking current Radicle status...",
+        f"Current RID: {status_result['stdout']}",
+        "\n2. 🌐 Checking current remotes...",
+        f"Current remotes:\n{remote_result['stdout']}"
+    )
     
-    # Use git through our MCP wrapper to add GitHub remote
-    print("\n3. 🐙 Adding GitHub remote...")
-    git_remote_result = await run_rad_command([
+    # Use git through our MCP process runner to add GitHub remote
+    git_remote_result = await run_process([
         "git", "remote", "add", "github", 
         "https://github.com/fovi-llc/radicle-mcp.git"
     ])
     
     if git_remote_result['success']:
-        print("✅ GitHub remote added successfully")
+        emit("\n3. 🐙 Adding GitHub remote...", "✅ GitHub remote added successfully")
     else:
-        print(f"⚠️  GitHub remote add result: {git_remote_result['stderr']}")
+        emit("\n3. 🐙 Adding GitHub remote...", f"⚠️  GitHub remote add result: {git_remote_result['stderr']}")
     
     # Fetch from GitHub to get the LICENSE file
     print("\n4. 📥 Fetching from GitHub...")
-    fetch_result = await run_rad_command(["git", "fetch", "github"])
-    
-    if fetch_result['success']:
+    # A ref listing is one small round trip; skip the fetch when our copy of
+    # main already matches
+    local_main, remote_main = await asyncio.gather(
+        run_process(["git", "rev-parse", "--verify", "--quiet", "refs/remotes/github/main"]),
+        run_process(["git", "ls-remote", "github", "refs/heads/main"], timeout=RAD_NETWORK_TIMEOUT)
+    )
+    remote_sha = remote_main['stdout'].partition("\t")[0]
+    if local_main['success'] and remote_main['success'] and remote_sha == local_main['stdout']:
+        print("✅ Already up to date with GitHub")
+    elif await run_streaming(["git", "fetch", "github"], timeout=RAD_NETWORK_TIMEOUT):
         print("✅ Successfully fetched from GitHub")
-        print(f"Fetch output: {fetch_result['stdout']}")
     else:
-        print(f"❌ Fetch failed: {fetch_result['stderr']}")
+        print("❌ Fetch failed")
     
     # Check what we got
-    print("\n5. 🔍 Checking GitHub branches...")
-    branch_result = await run_rad_command(["git", "branch", "-r"])
-    print(f"Remote branches: {branch_result['stdout']}")
+    branch_result = await run_process(["git", "branch", "-r"])
+    emit("\n5. 🔍 Checking GitHub branches...", f"Remote branches: {branch_result['stdout']}")
     
     # Merge or rebase with GitHub main if it exists
     print("\n6. 🔀 Merging GitHub changes...")
-    merge_result = await run_rad_command([
-        "git", "merge", "github/main", "--allow-unrelated-histories"
-    ])
-    
-    if merge_result['success']:
+    # Only histories with no common ancestor need the unrelated-histories merge
+    merge_base = await run_process(["git", "merge-base", "github/main", "HEAD"])
+    merge_command = ["git", "merge", "github/main"]
+    if not (merge_base['success'] and merge_base['stdout'].strip()):
+        merge_command.append("--allow-unrelated-histories")
+    if await run_streaming(merge_command):
         print("✅ Successfully merged GitHub changes")
     else:
-        print(f"⚠️  Merge result: {merge_result['stderr']}")
+        print("⚠️  Merge did not complete")
         # Try to continue anyway
     
-    # Stage all our new files
-    print("\n7. 📝 Staging local changes...")
-    add_result = await run_rad_command(["git", "add", "."])
-    
-    if add_result['success']:
-        print("✅ All files staged")
+    # Stage updates to tracked files, then our new files (one shell, as
+    # both need the index lock)
+    add_commands = [["git", "add", "-u"]]
+    published = existing_paths(PUBLISHED_PATHS)
+    if published:
+        add_commands.append(["git", "add", "--", *published])
+    add_results = await run_commands_in_shell(add_commands)
+    failed = [result for result in add_results if not result['success']]
+    
+    if not failed:
+        emit("\n7. 📝 Staging local changes...", "✅ All files staged")
     else:
-        print(f"❌ Failed to stage files: {add_result['stderr']}")
+        emit("\n7. 📝 Staging local changes...", f"❌ Failed to stage files: {failed[0]['stderr']}")
     
     # Commit our changes
-    print("\n8. 💾 Committing changes...")
-    commit_result = await run_rad_command([
-        "git", "commit", "-m", 
-        "Add Radicle + GitHub MCP server integration\n\n- Complete Python MCP server for Radicle CLI\n- GitHub MCP server integration\n- VS Code and Claude Desktop configuration\n- Setup and test scripts"
-    ])
+    commit_result = None
+    if pygit2 is not None:
+        try:
+            commit_id = await asyncio.to_thread(commit_in_process, COMMIT_MESSAGE)
+            if commit_id is None:
+                commit_result = {"success": False, "stderr": "nothing to commit"}
+            else:
+                commit_result = {"success": True, "stdout": f"[{str(commit_id)[:7]}] {COMMIT_MESSAGE.splitlines()[0]}"}
+        except (InProcessCommitUnavailable, pygit2.GitError, KeyError):
+            # e.g. hooks to run, or no user.name/user.email: let git handle it
+            pass
+    if commit_result is None:
+        commit_result = await run_process(["git", "commit", "-m", COMMIT_MESSAGE])
     
     if commit_result['success']:
-        print("✅ Changes committed successfully")
-        print(f"Commit result: {commit_result['stdout']}")
+        emit(
+            "\n8. 💾 Committing changes...",
+            "✅ Changes committed successfully",
+            f"Commit result: {commit_result['stdout']}"
+        )
     else:
-        print(f"⚠️  Commit result: {commit_result['stderr']}")
+        emit("\n8. 💾 Committing changes...", f"⚠️  Commit result: {commit_result['stderr']}")
     
     # Push to GitHub
     print("\n9. 🚀 Pushing to GitHub...")
-    push_result = await run_rad_command(["git", "push", "github", "main"])
-    
-    if push_result['success']:
+    if await run_streaming(["git", "push", "github", "main"], timeout=RAD_NETWORK_TIMEOUT):
         print("✅ Successfully pushed to GitHub!")
-        print(f"Push result: {push_result['stdout']}")
     else:
-        print(f"❌ Push failed: {push_result['stderr']}")
+        print("❌ Push failed")
     
-    print("\n🎉 MCP-powered GitHub sync complete!")
-    print("Your local changes are now synced with https://github.com/fovi-llc/radicle-mcp")
+    emit(
+        "\n🎉 MCP-powered GitHub sync complete!",
+        "Your local changes are now synced with https://github.com/fovi-llc/radicle-mcp"
+    )
 
 if __name__ == "__main__":
     asyncio.run(use_mcp_for_github_sync())
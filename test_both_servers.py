@@ -4,16 +4,27 @@ Test script to verify both Radicle and GitHub MCP servers are working.
 """
 
 import asyncio
+import shutil
 import subprocess
-import sys
 import os
-from pathlib import Path
+import sys
+from collections import deque
 
-# Add the src directory to the path for Radicle MCP
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+import _bootstrap  # noqa: F401  (puts src/ on sys.path if needed)
 
 from radicle_mcp.server import rad_help, rad_id
 
+# Looked up once per run; github-mcp falls back to where Deno installs it
+# in the dev container
+GITHUB_TOKEN = os.getenv("GITHUB_PERSONAL_ACCESS_TOKEN")
+DENO_PATH = shutil.which("deno")
+RAD_PATH = shutil.which("rad")
+GITHUB_MCP = shutil.which("github-mcp") or "/home/vscode/.deno/bin/github-mcp"
+GITHUB_MCP_BANNER = b"GitHub MCP Server running on stdio"
+GITHUB_MCP_STARTUP = 2.0
+# Also run the tools' --version (slower) rather than just finding them on PATH
+VERBOSE = "--verbose" in sys.argv[1:]
+
 async def test_radicle_mcp():
     """Test the Radicle MCP server."""
     print("🧪 Testing Radicle MCP Server...")
@@ -30,58 +41,103 @@ async def test_radicle_mcp():
         print(f"❌ Radicle MCP Server: Error - {e}")
         return False
 
-def test_github_mcp():
+async def test_github_mcp():
     """Test the GitHub MCP server."""
     print("🧪 Testing GitHub MCP Server...")
     try:
-        # Try to start the GitHub MCP server briefly
-        result = subprocess.run(
-            ["timeout", "2", "/home/vscode/.deno/bin/github-mcp"],
-            capture_output=True,
-            text=True,
-            timeout=3
+        # Start the GitHub MCP server and watch stderr for its startup banner
+        process = await asyncio.to_thread(
+            subprocess.Popen,
+            [GITHUB_MCP],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
         )
-        
-        # The server should start and run (timeout is expected)
-        if "GitHub MCP Server running on stdio" in result.stderr or result.returncode == 124:
-            print("✅ GitHub MCP Server: WORKING")
-            return True
-        else:
-            print(f"❌ GitHub MCP Server: Unexpected output - {result.stderr}")
-            return False
-            
-    except subprocess.TimeoutExpired:
-        print("✅ GitHub MCP Server: WORKING (started successfully)")
-        return True
     except FileNotFoundError:
         print("❌ GitHub MCP Server: Not found - please install with Deno")
         return False
     except Exception as e:
         print(f"❌ GitHub MCP Server: Error - {e}")
         return False
+    
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    transport, _ = await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), process.stderr)
+    deadline = loop.time() + GITHUB_MCP_STARTUP
+    # Raw lines are only decoded if the check fails, and only the last few
+    output = deque(maxlen=20)
+    try:
+        while True:
+            line = await asyncio.wait_for(reader.readline(), deadline - loop.time())
+            if GITHUB_MCP_BANNER in line:
+                print("✅ GitHub MCP Server: WORKING")
+                return True
+            if not line:
+                break
+            output.append(line)
+        
+        # It exited without announcing itself
+        print(f"❌ GitHub MCP Server: Unexpected output - {b''.join(output).decode(errors='replace').strip()}")
+        return False
+    except asyncio.TimeoutError:
+        # Still running, just quiet
+        print("✅ GitHub MCP Server: WORKING (started successfully)")
+        return True
+    finally:
+        transport.close()
+        if process.poll() is None:
+            process.terminate()
+        await asyncio.to_thread(process.wait)
+
+async def probe(command):
+    """The first line a command prints if it exits cleanly, else None."""
+    if command[0] is None:
+        return None
+    try:
+        # Run from a worker thread so the probes overlap without blocking the loop
+        result = await asyncio.to_thread(
+            subprocess.run, command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip().partition("\n")[0]
 
-def check_prerequisites():
+async def installed(name, path):
+    """Print and report whether a tool was found; with --verbose it must also run."""
+    if path is None:
+        return False
+    if not VERBOSE:
+        print(f"✅ {name}: Installed")
+        return True
+    version = await probe([path, "--version"])
+    if version is None:
+        return False
+    print(f"✅ {name}: Installed ({version})")
+    return True
+
+async def check_prerequisites():
     """Check if all prerequisites are met."""
     print("🔍 Checking Prerequisites...")
     
     issues = []
     
-    # Check if Deno is installed
-    try:
-        subprocess.run(["deno", "--version"], capture_output=True, check=True)
-        print("✅ Deno: Installed")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # Check if Deno and rad are installed; being on PATH is enough unless
+    # --verbose asks for their versions
+    deno_ok, rad_ok = await asyncio.gather(
+        installed("Deno", DENO_PATH),
+        installed("Radicle CLI", RAD_PATH)
+    )
+    
+    if not deno_ok:
         issues.append("❌ Deno: Not installed or not in PATH")
     
-    # Check if rad is available
-    try:
-        subprocess.run(["rad", "--version"], capture_output=True, check=True)
-        print("✅ Radicle CLI: Installed")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if not rad_ok:
         issues.append("❌ Radicle CLI: Not installed or not in PATH")
     
     # Check if GitHub token is set (optional but recommended)
-    if os.getenv("GITHUB_PERSONAL_ACCESS_TOKEN"):
+    if GITHUB_TOKEN:
         print("✅ GitHub Token: Set")
     else:
         issues.append("⚠️  GitHub Token: Not set (GitHub MCP will have limited functionality)")
@@ -93,18 +149,25 @@ async def main():
     print("🚀 Testing Radicle + GitHub MCP Setup")
     print("=" * 50)
     
-    # Check prerequisites
-    issues = check_prerequisites()
+    # Check prerequisites and test both servers at once; a test that
+    # raises counts as a failure
+    issues, radicle_ok, github_ok = await asyncio.gather(
+        check_prerequisites(),
+        test_radicle_mcp(),
+        test_github_mcp(),
+        return_exceptions=True
+    )
+    if isinstance(issues, BaseException):
+        issues = [f"❌ Prerequisite check failed: {issues}"]
+    radicle_ok = radicle_ok is True
+    github_ok = github_ok is True
+    
     if issues:
         print("\n⚠️  Issues found:")
         for issue in issues:
             print(f"  {issue}")
         print()
     
-    # Test both servers
-    radicle_ok = await test_radicle_mcp()
-    github_ok = test_github_mcp()
-    
     print("\n" + "=" * 50)
     print("📊 TEST RESULTS:")
     print(f"Radicle MCP Server: {'✅ PASS' if radicle_ok else '❌ FAIL'}")
@@ -3,10 +3,8 @@
 
 import asyncio
 import sys
-from pathlib import Path
 
-# Add the src directory to the path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+import _bootstrap  # noqa: F401  (puts src/ on sys.path if needed)
 
 from radicle_mcp.server import rad_help
 
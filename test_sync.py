@@ -7,10 +7,12 @@ import asyncio
 import os
 from github_radicle_sync import GitHubRadicleSyncer
 
+GITHUB_TOKEN = os.getenv("GITHUB_PERSONAL_ACCESS_TOKEN")
+
 
 async def test_sync_dry_run():
     """Test sync functionality in dry-run mode."""
-    github_token = os.getenv("GITHUB_PERSONAL_ACCESS_TOKEN")
+    github_token = GITHUB_TOKEN
     if not github_token:
         print("❌ GITHUB_PERSONAL_ACCESS_TOKEN environment variable not set")
         print("Please set it with: export GITHUB_PERSONAL_ACCESS_TOKEN=your_token_here")
@@ -21,29 +23,31 @@ async def test_sync_dry_run():
     print("🧪 Testing GitHub ↔ Radicle synchronization (dry-run mode)")
     print(f"GitHub repo: {github_repo}")
     
+    syncer = None
     try:
         syncer = GitHubRadicleSyncer(github_token, github_repo)
         
-        # Test GitHub API connectivity
+        # Test GitHub API and Radicle CLI connectivity; the probes are
+        # independent, so run them together
+        (github_issue_count, github_pr_count), radicle_issues, radicle_patches = await asyncio.gather(
+            syncer.github.count_items(),
+            syncer.radicle.get_issues(),
+            syncer.radicle.get_patches()
+        )
+        
         print("\n🔍 Testing GitHub API connection...")
-        github_issues = syncer.github.get_issues()
-        print(f"✅ Found {len(github_issues)} issues on GitHub")
+        print(f"✅ Found {github_issue_count} issues on GitHub")
         
-        # Test Radicle CLI connectivity
         print("\n🔍 Testing Radicle CLI connection...")
-        radicle_issues = await syncer.radicle.get_issues()
         print(f"✅ Found {len(radicle_issues)} issues in Radicle")
-        
-        radicle_patches = await syncer.radicle.get_patches()
         print(f"✅ Found {len(radicle_patches)} patches in Radicle")
         
-        github_prs = syncer.github.get_pull_requests()
-        print(f"✅ Found {len(github_prs)} pull requests on GitHub")
+        print(f"✅ Found {github_pr_count} pull requests on GitHub")
         
         # Display sync database status
         print(f"\n📊 Sync database status:")
-        print(f"  Issue mappings: {len(syncer.db.data.get('issues', {}))}")
-        print(f"  Patch mappings: {len(syncer.db.data.get('patches', {}))}")
+        print(f"  Issue mappings: {syncer.db.count('issues')}")
+        print(f"  Patch mappings: {syncer.db.count('patches')}")
         print(f"  Last sync: {syncer.db.data.get('last_sync', 'Never')}")
         
         print("\n✅ All connectivity tests passed!")
@@ -54,6 +58,9 @@ async def test_sync_dry_run():
     except Exception as e:
         print(f"❌ Test failed: {e}")
         return 1
+    finally:
+        if syncer is not None:
+            await syncer.close()
 
 
 if __name__ == "__main__":